@@ -407,20 +407,12 @@ class BaseCollection(object):
         correct_var = BaseCollection._check_conditional_statement(
             statement, len(data_collections))
 
-        # replace the operators of the statement with non-alphanumeric characters
-        # necessary to avoid replacing the characters of the operators
-        num_statement_clean = BaseCollection._replace_operators(statement)
-
+        # compile the statement once and evaluate it with the values at each step
+        code = compile(statement.lower(), '<statement>', 'eval')
         pattern = []
         for i in xrange(len(data_collections[0])):
-            num_statement = num_statement_clean
-            # replace the variable names with their numerical values
-            for j, coll in enumerate(data_collections):
-                var = correct_var[j]
-                num_statement = num_statement.replace(var, str(coll[i]))
-            # put back the operators
-            num_statement = BaseCollection._restore_operators(num_statement)
-            pattern.append(eval(num_statement, {}))
+            values = {var: coll[i] for var, coll in zip(correct_var, data_collections)}
+            pattern.append(eval(code, values))
         return pattern
 
     @staticmethod
@@ -546,24 +538,13 @@ class BaseCollection(object):
         return statement.lower().replace("and", "").replace("or", "") \
             .replace("not", "").replace("in", "").replace("is", "")
 
-    @staticmethod
-    def _replace_operators(statement):
-        """Replace logical operators of a statement with non-alphanumeric characters."""
-        return statement.lower().replace("and", "&&").replace("or", "||") \
-            .replace("not", "~").replace("in", "<<").replace("is", "$")
-
-    @staticmethod
-    def _restore_operators(statement):
-        """Restore python logical operators from previusly replaced ones."""
-        return statement.replace("&&", "and").replace("||", "or") \
-            .replace("~", "not").replace("<<", "in").replace("$", "is")
-
     def _filter_by_statement(self, statement):
         """Filter the data collection based on a conditional statement."""
         self.__class__._check_conditional_statement(statement, 1)
+        code = compile(statement, '<statement>', 'eval')
         _filt_values, _filt_datetimes = [], []
         for i, a in enumerate(self._values):
-            if eval(statement, {'a': a}):
+            if eval(code, {'a': a}):
                 _filt_values.append(a)
                 _filt_datetimes.append(self.datetimes[i])
         return _filt_values, _filt_datetimes
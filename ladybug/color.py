@@ -3,6 +3,7 @@
 from __future__ import division
 
 from collections import Iterable
+from bisect import bisect_left
 
 
 class Color(object):
@@ -80,14 +81,17 @@ class Color(object):
     def to_dict(self):
         """Get color as a dictionary."""
         return {
-            'r': self.r,
-            'g': self.g,
-            'b': self.b,
+            'r': self._r,
+            'g': self._g,
+            'b': self._b,
             'type': 'Color'
         }
 
     def __copy__(self):
-        return self.__class__(self.r, self.g, self.b)
+        # skip __init__ since the values of this color are already validated
+        new_color = self.__class__.__new__(self.__class__)
+        new_color._r, new_color._g, new_color._b = self._r, self._g, self._b
+        return new_color
 
     def __eq__(self, other):
         if isinstance(other, Color):
@@ -518,12 +522,12 @@ class ColorRange(object):
             return self._colors[-1]
 
         # find the index of the value in domain
-        for count, d in enumerate(self._domain):
-            if d <= value <= self._domain[count + 1]:
-                if self._continuous_colors:
-                    return self._cal_color(value, count)
-                else:
-                    return self._colors[count + 1]
+        count = bisect_left(self._domain, value, 1) - 1
+        if self._domain[count] <= value:  # False for values like NaN
+            if self._continuous_colors:
+                return self._cal_color(value, count)
+            else:
+                return self._colors[count + 1]
 
     def duplicate(self):
         """Return a copy of the current color range."""
@@ -547,11 +551,11 @@ class ColorRange(object):
         except ZeroDivisionError:
             factor = 0
 
-        min_color = self.colors[color_index]
-        max_color = self.colors[color_index + 1]
-        red = round(factor * (max_color.r - min_color.r) + min_color.r)
-        green = round(factor * (max_color.g - min_color.g) + min_color.g)
-        blue = round(factor * (max_color.b - min_color.b) + min_color.b)
+        min_color = self._colors[color_index]
+        max_color = self._colors[color_index + 1]
+        red = round(factor * (max_color._r - min_color._r) + min_color._r)
+        green = round(factor * (max_color._g - min_color._g) + min_color._g)
+        blue = round(factor * (max_color._b - min_color._b) + min_color._b)
 
         return Color(red, green, blue)
 
@@ -14,9 +14,9 @@ Properties:
         The keys of this dictionary are the data type names.
 """
 
-from .base import _DataTypeEnumeration
+from .base import _get_enumeration
 
-_data_types = _DataTypeEnumeration(import_modules=True)
+_data_types = _get_enumeration()
 TYPES = _data_types.types
 BASETYPES = _data_types.base_types
 UNITS = _data_types.units
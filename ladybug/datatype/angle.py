@@ -10,6 +10,7 @@ PI = math.pi
 
 class Angle(DataTypeBase):
     """Angle"""
+    __slots__ = ()
     _units = ('degrees', 'radians')
     _si_units = ('degrees', 'radians')
     _ip_units = ('degrees', 'radians')
@@ -40,5 +41,5 @@ class Angle(DataTypeBase):
 
 
 class WindDirection(Angle):
-    _name = 'Wind Direction'
+    __slots__ = ()
     _abbreviation = 'WD'
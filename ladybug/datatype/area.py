@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Area(DataTypeBase):
     """Area"""
+    __slots__ = ()
     _units = ('m2', 'ft2', 'mm2', 'in2', 'km2', 'mi2', 'cm2', 'ha', 'acre')
     _si_units = ('m2', 'mm2', 'km2', 'cm2', 'ha')
     _ip_units = ('ft2', 'in2', 'mi2', 'acre')
@@ -2,24 +2,34 @@
 """Base data type."""
 from __future__ import division
 
-from os.path import dirname, basename, isfile, join
-from os import listdir
+from os.path import dirname
 from importlib import import_module
+from pkgutil import iter_modules
+from collections import deque
 import re
 
+# pattern used to derive data type names from class names (eg. Dry Bulb Temperature)
+_NAME_PATTERN = re.compile(r"(?<=\w)([A-Z])")
+
+# types accepted as numbers when checking values before numerical operations
+_NUMBER_TYPES = (float, int)
+
+# translation table to remove special characters from unit abbreviations
+_CLEAN_TABLE = {ord('/'): u'_', ord('-'): None, ord(' '): None, ord('%'): u'pct'}
+
 
 class DataTypeBase(object):
     """Base class for data types.
 
     Properties:
         name: The full name of the data type as a string.
-        units: A list of all accetpable units of the data type as abbreviated text.
-            The first item of the list should be the standard SI unit.
-            The second item of the list should be the stadard IP unit (if it exists).
-            The rest of the list can be any other acceptable units.
-            (eg. [C, F, K])
-        si_units: A list of acceptable SI units.
-        ip_units: A list of acceptable IP units.
+        units: A tuple of all accetpable units of the data type as abbreviated text.
+            The first item of the tuple should be the standard SI unit.
+            The second item of the tuple should be the stadard IP unit (if it exists).
+            The rest of the tuple can be any other acceptable units.
+            (eg. (C, F, K))
+        si_units: A tuple of acceptable SI units.
+        ip_units: A tuple of acceptable IP units.
         min: Lower limit for the data type, values below which should be physically
             or mathematically impossible. (Default: -inf)
         max: Upper limit for the data type, values above which should be physically
@@ -44,10 +54,10 @@ class DataTypeBase(object):
             (False Examples: Temperature, Irradiance, Illuminance)
             (True Examples: Energy, Radiation)
     """
-    _name = None
-    _units = [None]
-    _si_units = [None]
-    _ip_units = [None]
+    __slots__ = ('_name',)
+    _units = (None,)
+    _si_units = (None,)
+    _ip_units = (None,)
     _min = float('-inf')
     _max = float('+inf')
 
@@ -56,7 +66,7 @@ class DataTypeBase(object):
     _point_in_time = True
     _cumulative = False
 
-    _type_enumeration = None
+    isDataType = True
 
     def __init__(self, name=None):
         """Initialize DataType.
@@ -78,26 +88,27 @@ class DataTypeBase(object):
                     "base_unit": the base unit of the data type
                 }
         """
-        assert 'name' in data, 'Required keyword "name" is missing!'
-        assert 'data_type' in data, 'Required keyword "data_type" is missing!'
-        if cls._type_enumeration is None:
-            cls._type_enumeration = _DataTypeEnumeration(import_modules=False)
-
-        if data['data_type'] == 'GenericType':
-            assert 'base_unit' in data, \
-                'Keyword "base_unit" is missing and is required for GenericType.'
-            return cls._type_enumeration._GENERICTYPE(data['name'], data['base_unit'])
-        elif data['data_type'] in cls._type_enumeration._TYPES:
-            clss = cls._type_enumeration._TYPES[data['data_type']]
-            if data['data_type'] == data['name'].title().replace(' ', ''):
-                return clss()
-            else:
-                instance = clss()
+        missing = [key for key in ('name', 'data_type') if key not in data]
+        if missing:
+            raise ValueError(
+                'Required keyword(s) {} missing!'.format(', '.join(missing)))
+        type_enumeration = _get_enumeration()
+        data_type = data['data_type']
+
+        clss = type_enumeration._TYPES.get(data_type)
+        if clss is not None:
+            instance = clss()
+            if data_type != _canonical_name(data['name']):
                 instance._name = data['name']
-                return instance
+            return instance
+        elif data_type == 'GenericType':
+            if 'base_unit' not in data:
+                raise ValueError(
+                    'Keyword "base_unit" is missing and is required for GenericType.')
+            return type_enumeration._GENERICTYPE(data['name'], data['base_unit'])
         else:
             raise ValueError(
-                'Data Type {} could not be recognized'.format(data['data_type']))
+                'Data Type {} could not be recognized'.format(data_type))
 
     def is_unit_acceptable(self, unit, raise_exception=True):
         """Check if a certain unit is acceptable for the data type.
@@ -106,7 +117,7 @@ class DataTypeBase(object):
             unit: A text string representing the abbreviated unit.
             raise_exception: Set to True to raise an exception if not acceptable.
         """
-        _is_acceptable = unit in self.units
+        _is_acceptable = unit in self._acceptable_units()
 
         if _is_acceptable or raise_exception is False:
             return _is_acceptable
@@ -150,15 +161,22 @@ class DataTypeBase(object):
             minimum = self.min
             maximum = self.max
         else:
-            namespace = {'self': self}
             self.is_unit_acceptable(unit, True)
-            min_statement = "self._{}_to_{}(self.min)".format(
-                self._clean(self.units[0]), self._clean(unit))
-            max_statement = "self._{}_to_{}(self.max)".format(
-                self._clean(self.units[0]), self._clean(unit))
-            minimum = eval(min_statement, namespace)
-            maximum = eval(max_statement, namespace)
+            converter = self._converters()[(self.units[0], unit)]
+            minimum = converter(self, self.min)
+            maximum = converter(self, self.max)
+
+        if len(values) == 0 or \
+                (minimum == float('-inf') and maximum == float('+inf')):
+            return True
+        if hasattr(values, 'dtype'):  # numpy array
+            low, high = values.min(), values.max()
+        else:
+            low, high = min(values), max(values)
+        if low >= minimum and high <= maximum:
+            return True
 
+        # find the first value out of range (if any) to report it
         for value in values:
             if value < minimum or value > maximum:
                 if not raise_exception:
@@ -180,7 +198,7 @@ class DataTypeBase(object):
         return {
             'name': self.name,
             'data_type': self.__class__.__name__,
-            'base_unit': self.units[0],
+            'base_unit': self._units[0],
             'type': 'DataTypeBase'
         }
 
@@ -188,42 +206,98 @@ class DataTypeBase(object):
     # Presently, I can't add a check for DataPoint type because it's outside the module
     def _is_numeric(self, values):
         """Check to be sure values are numbers before doing numerical operations."""
-        if len(values) > 0:
-            assert isinstance(values[0], (float, int)), \
-                "values must be numbers to perform math operations. Got {}".format(
-                    type(values[0]))
+        if isinstance(values, (list, tuple)):
+            if values and not isinstance(values[0], _NUMBER_TYPES):
+                raise AssertionError(
+                    'values must be numbers to perform math operations. '
+                    'Got {}'.format(type(values[0])))
+        elif hasattr(values, 'dtype'):  # numpy array
+            if values.dtype.kind not in 'fiu':
+                raise AssertionError(
+                    'values must be numbers to perform math operations. '
+                    'Got {}'.format(values.dtype))
+        elif len(values) > 0 and not isinstance(values[0], _NUMBER_TYPES):
+            raise AssertionError(
+                'values must be numbers to perform math operations. '
+                'Got {}'.format(type(values[0])))
         return True
 
     def _to_unit_base(self, base_unit, values, unit, from_unit):
         """Return values in a given unit given the input from_unit."""
         self._is_numeric(values)
-        namespace = {'self': self, 'values': values}
         if not from_unit == base_unit:
             self.is_unit_acceptable(from_unit, True)
-            statement = '[self._{}_to_{}(val) for val in values]'.format(
-                self._clean(from_unit), self._clean(base_unit))
-            values = eval(statement, namespace)
-            namespace['values'] = values
         if not unit == base_unit:
             self.is_unit_acceptable(unit, True)
-            statement = '[self._{}_to_{}(val) for val in values]'.format(
-                self._clean(base_unit), self._clean(unit))
-            values = eval(statement, namespace)
-        return values
+        elif from_unit == base_unit:
+            return values
+        converter = self._converters()[(from_unit, unit)]
+        return self._convert_values(converter, values)
+
+    def _convert_values(self, converter, values):
+        """Apply a converter function to a list of values.
 
-    def _clean(self, unit):
+        Numpy arrays are passed to the converter all at once since converters
+        are arithmetic expressions that also operate on whole arrays.
+        """
+        if hasattr(values, 'dtype'):
+            converted = converter(self, values)
+            return converted if converted is not values else values.copy()
+        return [converter(self, val) for val in values]
+
+    def _acceptable_units(self):
+        """Get a frozenset of all acceptable units, which is cached on the class."""
+        clss = self.__class__
+        unit_set = clss.__dict__.get('_unit_set')
+        if unit_set is None:
+            unit_set = clss._unit_set = frozenset(clss._units)
+        return unit_set
+
+    @classmethod
+    def _converters(cls):
+        """Get a dictionary of functions that convert values between any two units.
+
+        The dictionary is built once per class from the acceptable units and the
+        _[unit]_to_[unit] methods that convert between the base unit (the first
+        of the units) and every other unit. Keys are tuples of (from_unit, to_unit)
+        and conversions that pass through the base unit are fused into one function.
+        """
+        converters = cls.__dict__.get('_converter_table')
+        if converters is None:
+            base_unit = cls._units[0]
+            to_base, from_base = {}, {}
+            for unit in cls._units[1:]:
+                to_base[unit] = getattr(cls, '_{}_to_{}'.format(
+                    cls._clean(unit), cls._clean(base_unit)))
+                from_base[unit] = getattr(cls, '_{}_to_{}'.format(
+                    cls._clean(base_unit), cls._clean(unit)))
+            converters = {}
+            for from_unit, to_base_func in to_base.items():
+                converters[(from_unit, base_unit)] = to_base_func
+                converters[(base_unit, from_unit)] = from_base[from_unit]
+                for to_unit, from_base_func in from_base.items():
+                    converters[(from_unit, to_unit)] = \
+                        _fuse_converters(to_base_func, from_base_func)
+            cls._converter_table = converters
+        return converters
+
+    @staticmethod
+    def _clean(unit):
         """Clean out special characters from unit abbreviations."""
-        return unit.replace(
-            '/', '_').replace(
-                '-', '').replace(
-                    ' ', '').replace(
-                        '%', 'pct')
+        try:
+            return unit.translate(_CLEAN_TABLE)
+        except TypeError:  # byte string in Python 2
+            return unit.decode('utf-8').translate(_CLEAN_TABLE)
 
     @property
     def name(self):
         """The data type name."""
         if self._name is None:
-            return re.sub(r"(?<=\w)([A-Z])", r" \1", self.__class__.__name__)
+            clss = self.__class__
+            name = clss.__dict__.get('_derived_name')
+            if name is None:
+                name = clss._derived_name = _NAME_PATTERN.sub(r" \1", clss.__name__)
+            return name
         else:
             return self._name
 
@@ -276,11 +350,6 @@ class DataTypeBase(object):
         """Whether the data type is cumulative."""
         return self._cumulative
 
-    @property
-    def isDataType(self):
-        """Return True."""
-        return True
-
     def ToString(self):
         """Overwrite .NET ToString."""
         return self.__repr__()
@@ -292,6 +361,7 @@ class DataTypeBase(object):
 
 class _DataTypeEnumeration(object):
     """Enumerates all data types, base types, and units."""
+    __slots__ = ()
     _TYPES = {}
     _BASETYPES = {}
     _UNITS = {}
@@ -309,7 +379,7 @@ class _DataTypeEnumeration(object):
                 for subclss in self._all_subclasses(clss):
                     self._TYPES[subclss.__name__] = subclss
             else:
-                self._GENERICTYPE = clss
+                _DataTypeEnumeration._GENERICTYPE = clss
 
     @property
     def types(self):
@@ -341,16 +411,50 @@ class _DataTypeEnumeration(object):
         return self._TYPES
 
     def _import_modules(self):
-        root_dir = dirname(__file__)
-        modules = listdir(dirname(__file__))
-        modules = [join(root_dir, mod) for mod in modules]
-        importable = ['.{}'.format(basename(f)[:-3]) for f in modules
-                      if isfile(f) and f.endswith('.py')
-                      and not f.endswith('__init__.py')
-                      and not f.endswith('base.py')]
-        for mod in importable:
-            import_module(mod, 'ladybug.datatype')
+        for _, mod, _ in iter_modules([dirname(__file__)]):
+            if mod != 'base':
+                import_module('.{}'.format(mod), 'ladybug.datatype')
 
     def _all_subclasses(self, clss):
-        return set(clss.__subclasses__()).union(
-            [s for c in clss.__subclasses__() for s in self._all_subclasses(c)])
+        subclasses, to_visit = set(), deque([clss])
+        while to_visit:
+            for subclss in to_visit.popleft().__subclasses__():
+                if subclss not in subclasses:
+                    subclasses.add(subclss)
+                    to_visit.append(subclss)
+        return subclasses
+
+
+_CANONICAL_NAMES = {}
+
+
+def _canonical_name(name):
+    """Get the class name corresponding to a data type name (eg. DryBulbTemperature).
+
+    Results are cached since the same few names recur when loading many data types.
+    """
+    try:
+        return _CANONICAL_NAMES[name]
+    except KeyError:
+        if len(_CANONICAL_NAMES) >= 256:
+            _CANONICAL_NAMES.clear()
+        canonical = _CANONICAL_NAMES[name] = name.title().replace(' ', '')
+        return canonical
+
+
+def _fuse_converters(first, second):
+    """Fuse two converter functions into a single function applying both."""
+    def converter(data_type, value):
+        return second(data_type, first(data_type, value))
+    return converter
+
+
+_TYPE_ENUMERATION = None
+
+
+def _get_enumeration():
+    """Get the enumeration of all data types, which is built upon first request."""
+    global _TYPE_ENUMERATION
+    if _TYPE_ENUMERATION is None:
+        _TYPE_ENUMERATION = _DataTypeEnumeration(import_modules=True)
+    return _TYPE_ENUMERATION
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Distance(DataTypeBase):
     """Distance"""
+    __slots__ = ()
     _units = ('m', 'ft', 'mm', 'in', 'km', 'mi', 'cm')
     _si_units = ('m', 'mm', 'km', 'cm')
     _ip_units = ('ft', 'in', 'mi')
@@ -82,25 +83,30 @@ class Distance(DataTypeBase):
 
 
 class Visibility(Distance):
+    __slots__ = ()
     _abbreviation = 'Vis'
     _missing_epw = 9999
 
 
 class CeilingHeight(Distance):
+    __slots__ = ()
     _abbreviation = 'Hciel'
     _missing_epw = 99999
 
 
 class PrecipitableWater(Distance):
+    __slots__ = ()
     _abbreviation = 'PW'
     _missing_epw = 999
 
 
 class SnowDepth(Distance):
+    __slots__ = ()
     _abbreviation = 'Dsnow'
     _missing_epw = 999
 
 
 class LiquidPrecipitationDepth(Distance):
+    __slots__ = ()
     _abbreviation = 'LPD'
     _missing_epw = 999
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Energy(DataTypeBase):
     """Energy"""
+    __slots__ = ()
     _units = ('kWh', 'kBtu', 'Wh', 'Btu', 'MMBtu', 'J', 'kJ', 'MJ', 'GJ',
               'therm', 'cal', 'kcal')
     _si_units = ('kWh', 'Wh', 'J', 'kJ', 'MJ', 'GJ')
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class EnergyFlux(DataTypeBase):
     """Energy Flux"""
+    __slots__ = ()
     _units = ('W/m2', 'Btu/h-ft2', 'kW/m2', 'kBtu/h-ft2', 'W/ft2', 'met')
     _si_units = ('W/m2', 'kW/m2')
     _ip_units = ('Btu/h-ft2', 'kBtu/h-ft2')
@@ -72,15 +73,18 @@ class EnergyFlux(DataTypeBase):
 
 
 class MetabolicRate(EnergyFlux):
+    __slots__ = ()
     _min = 0
     _abbreviation = 'MetR'
 
 
 class EffectiveRadiantField(EnergyFlux):
+    __slots__ = ()
     _abbreviation = 'ERF'
 
 
 class Irradiance(EnergyFlux):
+    __slots__ = ()
     _min = 0
     _abbreviation = 'Qsolar'
 
@@ -91,21 +95,26 @@ class Irradiance(EnergyFlux):
 
 
 class GlobalHorizontalIrradiance(Irradiance):
+    __slots__ = ()
     _abbreviation = 'GHIr'
 
 
 class DirectNormalIrradiance(Irradiance):
+    __slots__ = ()
     _abbreviation = 'DNIr'
 
 
 class DiffuseHorizontalIrradiance(Irradiance):
+    __slots__ = ()
     _abbreviation = 'DHIr'
 
 
 class DirectHorizontalIrradiance(Irradiance):
+    __slots__ = ()
     _abbreviation = 'DHIr'
 
 
 class HorizontalInfraredRadiationIntensity(Irradiance):
+    __slots__ = ()
     _abbreviation = 'HIr'
     _point_in_time = True
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class EnergyIntensity(DataTypeBase):
     """Energy Intensity"""
+    __slots__ = ()
     _units = ('kWh/m2', 'kBtu/ft2', 'Wh/m2', 'Btu/ft2')
     _si_units = ('kWh/m2', 'Wh/m2')
     _ip_units = ('kBtu/ft2', 'Btu/ft2')
@@ -61,6 +62,7 @@ class EnergyIntensity(DataTypeBase):
 
 
 class Radiation(EnergyIntensity):
+    __slots__ = ()
     _min = 0
     _abbreviation = 'Esolar'
 
@@ -71,24 +73,30 @@ class Radiation(EnergyIntensity):
 
 
 class GlobalHorizontalRadiation(Radiation):
+    __slots__ = ()
     _abbreviation = 'GHR'
 
 
 class DirectNormalRadiation(Radiation):
+    __slots__ = ()
     _abbreviation = 'DNR'
 
 
 class DiffuseHorizontalRadiation(Radiation):
+    __slots__ = ()
     _abbreviation = 'DHR'
 
 
 class DirectHorizontalRadiation(Radiation):
+    __slots__ = ()
     _abbreviation = 'DR'
 
 
 class ExtraterrestrialHorizontalRadiation(Radiation):
+    __slots__ = ()
     _abbreviation = 'HRex'
 
 
 class ExtraterrestrialDirectNormalRadiation(Radiation):
+    __slots__ = ()
     _abbreviation = 'DNRex'
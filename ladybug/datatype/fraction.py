@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Fraction(DataTypeBase):
     """Fraction"""
+    __slots__ = ()
     _units = ('fraction', '%', 'tenths', 'thousandths', 'okta')
     _si_units = ('fraction', '%', 'tenths', 'thousandths', 'okta')
     _ip_units = ('fraction', '%', 'tenths', 'thousandths', 'okta')
@@ -55,23 +56,27 @@ class Fraction(DataTypeBase):
 
 
 class PercentagePeopleDissatisfied(Fraction):
+    __slots__ = ()
     _min = 0
     _max = 1
     _abbreviation = 'PPD'
 
 
 class RelativeHumidity(Fraction):
+    __slots__ = ()
     _min = 0
     _abbreviation = 'RH'
 
 
 class HumidityRatio(Fraction):
+    __slots__ = ()
     _min = 0
     _max = 1
     _abbreviation = 'HR'
 
 
 class TotalSkyCover(Fraction):
+    __slots__ = ()
     # (used if Horizontal IR Intensity missing)
     _min = 0
     _max = 1
@@ -79,6 +84,7 @@ class TotalSkyCover(Fraction):
 
 
 class OpaqueSkyCover(Fraction):
+    __slots__ = ()
     # (used if Horizontal IR Intensity missing)
     _min = 0
     _max = 1
@@ -86,17 +92,20 @@ class OpaqueSkyCover(Fraction):
 
 
 class AerosolOpticalDepth(Fraction):
+    __slots__ = ()
     _min = 0
     _max = 1
     _abbreviation = 'AOD'
 
 
 class Albedo(Fraction):
+    __slots__ = ()
     _min = 0
     _max = 1
     _abbreviation = 'a'
 
 
 class LiquidPrecipitationQuantity(Fraction):
+    __slots__ = ()
     _min = 0
     _abbreviation = 'LPQ'
@@ -7,6 +7,9 @@ from .base import DataTypeBase
 
 class GenericType(DataTypeBase):
     """Type for any data type that is not currently implemented."""
+    __slots__ = ('_units', '_unit_set', '_min', '_max', '_abbreviation',
+                 '_unit_descr', '_point_in_time', '_cumulative')
+
     def __init__(self, name, unit, min=float('-inf'), max=float('+inf'),
                  abbreviation=None, unit_descr=None, point_in_time=True,
                  cumulative=False):
@@ -54,7 +57,8 @@ class GenericType(DataTypeBase):
                 'point_in_time is also True.'
 
         self._name = name
-        self._units = [unit]
+        self._units = (unit,)
+        self._unit_set = frozenset(self._units)
         self._min = min
         self._max = max
         self._abbreviation = abbreviation if abbreviation is not None else name
@@ -62,6 +66,10 @@ class GenericType(DataTypeBase):
         self._point_in_time = point_in_time
         self._cumulative = cumulative
 
+    def _acceptable_units(self):
+        """Get a frozenset of all acceptable units."""
+        return self._unit_set
+
     def to_ip(self, values, from_unit):
         """Return values in IP and the units to which the values have been converted."""
         return values, from_unit
@@ -7,9 +7,10 @@ from .base import DataTypeBase
 
 class Illuminance(DataTypeBase):
     """Illuminance"""
+    __slots__ = ()
     _units = ('lux', 'fc')
-    _si_units = ('lux')
-    _ip_units = ('fc')
+    _si_units = ('lux',)
+    _ip_units = ('fc',)
     _min = 0
     _abbreviation = 'Ev'
     _point_in_time = False
@@ -45,12 +46,15 @@ class Illuminance(DataTypeBase):
 
 
 class GlobalHorizontalIlluminance(Illuminance):
+    __slots__ = ()
     _abbreviation = 'GHI'
 
 
 class DirectNormalIlluminance(Illuminance):
+    __slots__ = ()
     _abbreviation = 'DNI'
 
 
 class DiffuseHorizontalIlluminance(Illuminance):
+    __slots__ = ()
     _abbreviation = 'DHI'
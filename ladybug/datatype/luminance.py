@@ -7,9 +7,10 @@ from .base import DataTypeBase
 
 class Luminance(DataTypeBase):
     """Luminance"""
+    __slots__ = ()
     _units = ('cd/m2', 'cd/ft2')
-    _si_units = ('cd/m2')
-    _ip_units = ('cd/ft2')
+    _si_units = ('cd/m2',)
+    _ip_units = ('cd/ft2',)
     _min = 0
     _abbreviation = 'Lv'
     _point_in_time = False
@@ -45,4 +46,5 @@ class Luminance(DataTypeBase):
 
 
 class ZenithLuminance(Luminance):
+    __slots__ = ()
     _abbreviation = 'ZL'
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Mass(DataTypeBase):
     """Mass"""
+    __slots__ = ()
     _units = ('kg', 'lb', 'g', 'tonne', 'ton', 'oz')
     _si_units = ('kg', 'g', 'tonne')
     _ip_units = ('lb', 'ton')
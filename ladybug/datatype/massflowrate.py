@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class MassFlowRate(DataTypeBase):
     """Mass"""
+    __slots__ = ()
     _units = ('kg/s', 'lb/s', 'g/s', 'oz/s')
     _si_units = ('kg/s', 'g/s')
     _ip_units = ('lb/s', 'oz/s')
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Power(DataTypeBase):
     """Power"""
+    __slots__ = ()
     _units = ('W', 'Btu/h', 'kW', 'kBtu/h', 'TR', 'hp')
     _si_units = ('kW', 'W')
     _ip_units = ('Btu/h', 'kBtu/h', 'TR', 'hp')
@@ -72,5 +73,6 @@ class Power(DataTypeBase):
 
 
 class ActivityLevel(Power):
+    __slots__ = ()
     _abbreviation = 'Activity'
     _min = 0
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Pressure(DataTypeBase):
     """Pressure"""
+    __slots__ = ()
     _units = ('Pa', 'inHg', 'atm', 'bar', 'Torr', 'psi', 'inH2O')
     _si_units = ('Pa', 'bar')
     _ip_units = ('inHg', 'psi', 'inH2O')
@@ -74,5 +75,6 @@ class Pressure(DataTypeBase):
 
 
 class AtmosphericStationPressure(Pressure):
+    __slots__ = ()
     _min = 0
     _abbreviation = 'Patm'
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class RValue(DataTypeBase):
     """R Value"""
+    __slots__ = ()
     _units = ('m2-K/W', 'h-ft2-F/Btu', 'clo')
     _si_units = ('m2-K/W', 'clo')
     _ip_units = ('h-ft2-F/Btu', 'clo')
@@ -50,5 +51,6 @@ class RValue(DataTypeBase):
 
 
 class ClothingInsulation(RValue):
+    __slots__ = ()
     _abbreviation = 'Rclo'
     _unit_descr = {0: 'No Clothing', 0.5: 'T-shirt + Shorts', 1: '3-piece Suit'}
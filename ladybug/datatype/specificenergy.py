@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class SpecificEnergy(DataTypeBase):
     """Energy"""
+    __slots__ = ()
     _units = ('kWh/kg', 'kBtu/lb', 'Wh/kg', 'Btu/lb', 'J/kg', 'kJ/kg')
     _si_units = ('kWh/kg', 'Wh/kg', 'J/kg', 'kJ/kg')
     _ip_units = ('Btu/lb', 'kBtu/lb')
@@ -73,5 +74,6 @@ class SpecificEnergy(DataTypeBase):
 
 
 class Enthalpy(SpecificEnergy):
+    __slots__ = ()
     _abbreviation = 'Enth'
     _min = 0
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Speed(DataTypeBase):
     """Speed"""
+    __slots__ = ()
     _units = ('m/s', 'mph', 'km/h', 'knot', 'ft/s')
     _si_units = ('m/s', 'km/h')
     _ip_units = ('mph', 'ft/s')
@@ -62,8 +63,10 @@ class Speed(DataTypeBase):
 
 
 class WindSpeed(Speed):
+    __slots__ = ()
     _abbreviation = 'WS'
 
 
 class AirSpeed(Speed):
+    __slots__ = ()
     _abbreviation = 'vair'
@@ -7,9 +7,10 @@ from .base import DataTypeBase
 
 class Temperature(DataTypeBase):
     """Temperature"""
+    __slots__ = ()
     _units = ('C', 'F', 'K')
     _si_units = ('C', 'K')
-    _ip_units = ('F')
+    _ip_units = ('F',)
     _min = -273.15
     _abbreviation = 'T'
 
@@ -50,48 +51,60 @@ class Temperature(DataTypeBase):
 
 
 class DryBulbTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'DBT'
 
 
 class DewPointTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'DPT'
 
 
 class WetBulbTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'WBT'
 
 
 class SkyTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'Tsky'
 
 
 class GroundTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'Tground'
 
 
 class AirTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'Tair'
 
 
 class RadiantTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'Trad'
 
 
 class OperativeTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'To'
 
 
 class MeanRadiantTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'MRT'
 
 
 class StandardEffectiveTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'SET'
 
 
 class UniversalThermalClimateIndex(Temperature):
+    __slots__ = ()
     _abbreviation = 'UTCI'
 
 
 class PrevailingOutdoorTemperature(Temperature):
+    __slots__ = ()
     _abbreviation = 'Tprevail'
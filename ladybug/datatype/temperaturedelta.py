@@ -7,9 +7,10 @@ from .base import DataTypeBase
 
 class TemperatureDelta(DataTypeBase):
     """Temperature"""
+    __slots__ = ()
     _units = ('C', 'F', 'K')
     _si_units = ('C', 'K')
-    _ip_units = ('F')
+    _ip_units = ('F',)
     _abbreviation = 'DeltaT'
 
     def _C_to_F(self, value):
@@ -49,12 +50,15 @@ class TemperatureDelta(DataTypeBase):
 
 
 class AirTemperatureDelta(TemperatureDelta):
+    __slots__ = ()
     _abbreviation = 'DeltaTair'
 
 
 class RadiantTemperatureDelta(TemperatureDelta):
+    __slots__ = ()
     _abbreviation = 'DeltaTrad'
 
 
 class OperativeTemperatureDelta(TemperatureDelta):
+    __slots__ = ()
     _abbreviation = 'DeltaTo'
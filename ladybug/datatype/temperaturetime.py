@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class TemperatureTime(DataTypeBase):
     """Temperature-Time"""
+    __slots__ = ()
     _units = ('degC-days', 'degF-days', 'degC-hours', 'degF-hours')
     _si_units = ('degC-days', 'degC-hours')
     _ip_units = ('degF-days', 'degF-hours')
@@ -59,8 +60,10 @@ class TemperatureTime(DataTypeBase):
 
 
 class CoolingDegreeTime(TemperatureTime):
+    __slots__ = ()
     _abbreviation = 'coolTime'
 
 
 class HeatingDegreeTime(TemperatureTime):
+    __slots__ = ()
     _abbreviation = 'heatTime'
@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class ThermalCondition(DataTypeBase):
     """Thermal Condition"""
+    __slots__ = ()
     _units = ('condition', 'PMV')
     _si_units = ('condition', 'PMV')
     _ip_units = ('condition', 'PMV')
@@ -40,6 +41,7 @@ class ThermalCondition(DataTypeBase):
 
 
 class PredictedMeanVote(ThermalCondition):
+    __slots__ = ()
     _min = float('-inf')
     _max = float('+inf')
     _abbreviation = 'PMV'
@@ -48,6 +50,7 @@ class PredictedMeanVote(ThermalCondition):
 
 
 class ThermalComfort(ThermalCondition):
+    __slots__ = ()
     _min = 0
     _max = 1
     _abbreviation = 'TC'
@@ -55,6 +58,7 @@ class ThermalComfort(ThermalCondition):
 
 
 class DiscomfortReason(ThermalCondition):
+    __slots__ = ()
     _min = -2
     _max = 2
     _abbreviation = 'RDiscomf'
@@ -63,6 +67,7 @@ class DiscomfortReason(ThermalCondition):
 
 
 class ThermalConditionFivePoint(ThermalCondition):
+    __slots__ = ()
     _min = -2
     _max = 2
     _abbreviation = 'Tcond-5'
@@ -71,6 +76,7 @@ class ThermalConditionFivePoint(ThermalCondition):
 
 
 class ThermalConditionSevenPoint(ThermalCondition):
+    __slots__ = ()
     _min = -3
     _max = 3
     _abbreviation = 'Tcond-7'
@@ -80,6 +86,7 @@ class ThermalConditionSevenPoint(ThermalCondition):
 
 
 class ThermalConditionNinePoint(ThermalCondition):
+    __slots__ = ()
     _min = -4
     _max = 4
     _abbreviation = 'Tcond-9'
@@ -90,6 +97,7 @@ class ThermalConditionNinePoint(ThermalCondition):
 
 
 class ThermalConditionElevenPoint(ThermalCondition):
+    __slots__ = ()
     _min = -5
     _max = 5
     _abbreviation = 'Tcond-11'
@@ -100,6 +108,7 @@ class ThermalConditionElevenPoint(ThermalCondition):
 
 
 class UTCICategory(ThermalCondition):
+    __slots__ = ()
     _min = 0
     _max = 9
     _abbreviation = 'UTCIcond'
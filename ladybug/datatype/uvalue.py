@@ -7,9 +7,10 @@ from .base import DataTypeBase
 
 class UValue(DataTypeBase):
     """U Value"""
+    __slots__ = ()
     _units = ('W/m2-K', 'Btu/h-ft2-F')
-    _si_units = ('W/m2-K')
-    _ip_units = ('Btu/h-ft2-F')
+    _si_units = ('W/m2-K',)
+    _ip_units = ('Btu/h-ft2-F',)
     _min = 0
     _abbreviation = 'Uval'
 
@@ -44,8 +45,10 @@ class UValue(DataTypeBase):
 
 
 class ConvectionCoefficient(UValue):
+    __slots__ = ()
     _abbreviation = 'hc'
 
 
 class RadiantCoefficient(UValue):
+    __slots__ = ()
     _abbreviation = 'hr'
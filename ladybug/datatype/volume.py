@@ -7,6 +7,7 @@ from .base import DataTypeBase
 
 class Volume(DataTypeBase):
     """Volume"""
+    __slots__ = ()
     _units = ('m3', 'ft3', 'mm3', 'in3', 'km3', 'mi3', 'L', 'mL', 'gal', 'fl oz')
     _si_units = ('m3', 'mm3', 'km3', 'L', 'mL')
     _ip_units = ('ft3', 'in3', 'mi3', 'gal', 'fl oz')
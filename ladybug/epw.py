@@ -9,16 +9,41 @@ from .header import Header
 from .analysisperiod import AnalysisPeriod
 from .datatype import angle, distance, energyflux, energyintensity, generic, \
     illuminance, luminance, fraction, pressure, speed, temperature
-from .skymodel import calc_sky_temperature
-from .futil import write_to_file
+from .skymodel import calc_sky_temperatures
+from .futil import write_lines_to_file
 
 import os
-readmode = 'rb'
+import locale
+from operator import itemgetter
+from itertools import chain
 try:
     from itertools import izip as zip  # python 2
 except ImportError:
     xrange = range  # python 3
-    readmode = 'r'
+
+# epw files are read as bytes and only the text fields are decoded (python 3)
+_ENCODING = locale.getpreferredencoding(False)
+
+
+def _decode(text):
+    """Decode bytes read from an epw file into text."""
+    return text if isinstance(text, str) else text.decode(_ENCODING)
+
+
+def _int_or_round(value):
+    """Convert a field of an epw file to an integer, rounding any decimal value."""
+    if b'.' in value or b'e' in value or b'E' in value:
+        return int(round(float(value)))
+    return int(value)
+
+
+# design condition keys and getters for their values in the order of the epw header
+_HEATING_KEYS = DesignDay.heating_keys
+_COOLING_KEYS = DesignDay.cooling_keys
+_EXTREME_KEYS = DesignDay.extreme_keys
+_HEATING_VALUES = itemgetter(*_HEATING_KEYS)
+_COOLING_VALUES = itemgetter(*_COOLING_KEYS)
+_EXTREME_VALUES = itemgetter(*_EXTREME_KEYS)
 
 
 class EPW(object):
@@ -80,6 +105,7 @@ class EPW(object):
         """
         self._file_path = os.path.normpath(file_path) if file_path is not None else None
         self._is_header_loaded = False
+        self._is_climate_loaded = file_path is None  # design conditions, weeks, etc.
         self._is_data_loaded = False
         self._is_ip = False  # track if collections have been coverted to IP
 
@@ -141,33 +167,38 @@ class EPW(object):
         # create an annual analysis period
         analysis_period = AnalysisPeriod(is_leap_year=is_leap_year)
 
-        # create headers and an empty list for each field in epw file
+        # create headers for each field in epw file
+        fields = [EPWFields.field_by_number(i) for i in xrange(epw_obj._num_of_fields)]
         headers = []
-        for field_number in xrange(epw_obj._num_of_fields):
-            field = EPWFields.field_by_number(field_number)
+        for field in fields:
             header = Header(data_type=field.name, unit=field.unit,
                             analysis_period=analysis_period)
             headers.append(header)
-            epw_obj._data.append([])
 
         # fill in missing datetime values and uncertainty flags.
+        # each day starts at midnight, which is written as hour 24 of that day.
+        year = 2016 if is_leap_year else 2017
+        days_each_month = AnalysisPeriod.NUMOFDAYSEACHMONTHLEAP if is_leap_year \
+            else AnalysisPeriod.NUMOFDAYSEACHMONTH
+        months, days = [], []
+        for month, num_days in enumerate(days_each_month, 1):
+            months.extend([month] * (num_days * 24))
+            days.extend([day for day in xrange(1, num_days + 1) for hr in xrange(24)])
+        calc_length = len(months)
         uncertainty = '?9?9?9?9E0?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9*9*9?9?9?9'
-        for dt in analysis_period.datetimes:
-            hr = dt.hour if dt.hour != 0 else 24
-            epw_obj._data[0].append(dt.year)
-            epw_obj._data[1].append(dt.month)
-            epw_obj._data[2].append(dt.day)
-            epw_obj._data[3].append(hr)
-            epw_obj._data[4].append(0)
-            epw_obj._data[5].append(uncertainty)
+        epw_obj._data = [
+            [year] * calc_length,
+            months,
+            days,
+            ([24] + list(xrange(1, 24))) * (calc_length // 24),
+            [0] * calc_length,
+            [uncertainty] * calc_length
+        ]
 
         # generate missing hourly data
-        calc_length = len(analysis_period.datetimes)
-        for field_number in xrange(6, epw_obj._num_of_fields):
-            field = EPWFields.field_by_number(field_number)
+        for field in fields[6:]:
             mis_val = field.missing if field.missing is not None else 0
-            for dt in xrange(calc_length):
-                epw_obj._data[field_number].append(mis_val)
+            epw_obj._data.append([mis_val] * calc_length)
 
         # finally, build the data collection objects from the headers and data
         for i in xrange(epw_obj._num_of_fields):
@@ -322,15 +353,15 @@ class EPW(object):
             'must be a dictionary. Got {}.'.format(type(meta_d))
         self._metadata = meta_d
         for coll in self._data:
-            coll.header._metadata = meta_d
+            if coll is not None:  # fields that are not imported yet get it on import
+                coll.header._metadata = meta_d
 
     @property
     def annual_heating_design_day_996(self):
         """A design day object representing the annual 99.6% heating design day."""
-        self._load_header_check()
-        if bool(self._heating_dict) is True:
-            avg_press = self.atmospheric_station_pressure.average
-            avg_press = None if avg_press == 999999 else avg_press
+        self._load_climate_check()
+        if self._heating_dict:
+            avg_press = self._average_station_pressure()
             return DesignDay.from_ashrae_dict_heating(
                 self._heating_dict, self.location, False, avg_press)
         else:
@@ -339,10 +370,9 @@ class EPW(object):
     @property
     def annual_heating_design_day_990(self):
         """A design day object representing the annual 99.0% heating design day."""
-        self._load_header_check()
-        if bool(self._heating_dict) is True:
-            avg_press = self.atmospheric_station_pressure.average
-            avg_press = None if avg_press == 999999 else avg_press
+        self._load_climate_check()
+        if self._heating_dict:
+            avg_press = self._average_station_pressure()
             return DesignDay.from_ashrae_dict_heating(
                 self._heating_dict, self.location, True, avg_press)
         else:
@@ -351,10 +381,9 @@ class EPW(object):
     @property
     def annual_cooling_design_day_004(self):
         """A design day object representing the annual 0.4% cooling design day."""
-        self._load_header_check()
-        if bool(self._cooling_dict) is True:
-            avg_press = self.atmospheric_station_pressure.average
-            avg_press = None if avg_press == 999999 else avg_press
+        self._load_climate_check()
+        if self._cooling_dict:
+            avg_press = self._average_station_pressure()
             return DesignDay.from_ashrae_dict_cooling(
                 self._cooling_dict, self.location, False, avg_press)
         else:
@@ -363,10 +392,9 @@ class EPW(object):
     @property
     def annual_cooling_design_day_010(self):
         """A design day object representing the annual 1.0% cooling design day."""
-        self._load_header_check()
-        if bool(self._cooling_dict) is True:
-            avg_press = self.atmospheric_station_pressure.average
-            avg_press = None if avg_press == 999999 else avg_press
+        self._load_climate_check()
+        if self._cooling_dict:
+            avg_press = self._average_station_pressure()
             return DesignDay.from_ashrae_dict_cooling(
                 self._cooling_dict, self.location, True, avg_press)
         else:
@@ -375,76 +403,75 @@ class EPW(object):
     @property
     def heating_design_condition_dictionary(self):
         """Dictionary with ASHRAE HOF Climate Design Data for heating conditions."""
-        self._load_header_check()
+        self._load_climate_check()
         return self._heating_dict
 
     @heating_design_condition_dictionary.setter
     def heating_design_condition_dictionary(self, des_dict):
-        self._load_header_check()
-        self._des_dict_check(des_dict, DesignDay.heating_keys,
+        self._load_climate_check()
+        self._des_dict_check(des_dict, _HEATING_KEYS,
                              'heating_design_condition_dictionary')
         self._heating_dict = des_dict
 
     @property
     def cooling_design_condition_dictionary(self):
         """Dictionary with ASHRAE HOF Climate Design Data for cooling conditions."""
-        self._load_header_check()
+        self._load_climate_check()
         return self._cooling_dict
 
     @cooling_design_condition_dictionary.setter
     def cooling_design_condition_dictionary(self, des_dict):
-        self._load_header_check()
-        self._des_dict_check(des_dict, DesignDay.cooling_keys,
+        self._load_climate_check()
+        self._des_dict_check(des_dict, _COOLING_KEYS,
                              'cooling_design_condition_dictionary')
         self._cooling_dict = des_dict
 
     @property
     def extreme_design_condition_dictionary(self):
         """Dictionary with ASHRAE HOF Climate Design Data for extreme conditions."""
-        self._load_header_check()
+        self._load_climate_check()
         return self._extremes_dict
 
     @extreme_design_condition_dictionary.setter
     def extreme_design_condition_dictionary(self, des_dict):
-        self._load_header_check()
-        self._des_dict_check(des_dict, DesignDay.extreme_keys,
+        self._load_climate_check()
+        self._des_dict_check(des_dict, _EXTREME_KEYS,
                              'extreme_design_condition_dictionary')
         self._extremes_dict = des_dict
 
     @property
     def extreme_cold_weeks(self):
         """A dictionary with AnalysisPeriods for the coldest weeks within the EPW."""
-        self._load_header_check()
-        self._extreme_cold_weeks.values()
+        self._load_climate_check()
         return self._extreme_cold_weeks
 
     @extreme_cold_weeks.setter
     def extreme_cold_weeks(self, data):
-        self._load_header_check()
+        self._load_climate_check()
         self._weeks_check(data, 'extreme_cold_weeks')
-        self._extreme_cold_weeks = dict(data)
+        self._extreme_cold_weeks = data
 
     @property
     def extreme_hot_weeks(self):
         """A dictionary with AnalysisPeriods for the hottest week within the EPW."""
-        self._load_header_check()
+        self._load_climate_check()
         return self._extreme_hot_weeks
 
     @extreme_hot_weeks.setter
     def extreme_hot_weeks(self, data):
-        self._load_header_check()
+        self._load_climate_check()
         self._weeks_check(data, 'extreme_hot_weeks')
         self._extreme_hot_weeks = data
 
     @property
     def typical_weeks(self):
         """A dictionary with AnalysisPeriods for the typical weeks within the EPW."""
-        self._load_header_check()
+        self._load_climate_check()
         return self._typical_weeks
 
     @typical_weeks.setter
     def typical_weeks(self, data):
-        self._load_header_check()
+        self._load_climate_check()
         self._weeks_check(data, 'typical_weeks')
         self._typical_weeks = data
 
@@ -454,15 +481,15 @@ class EPW(object):
 
         The keys of this dictionary are the depths at which each set
         of temperatures occurrs."""
-        self._load_header_check()
+        self._load_climate_check()
         return self._monthly_ground_temps
 
     @monthly_ground_temperature.setter
     def monthly_ground_temperature(self, data):
-        self._load_header_check()
+        self._load_climate_check()
         assert isinstance(data, dict), 'monthly_ground_temperature' \
             ' must be an OrderedDict. Got {}.'.format(type(data))
-        if bool(data) is True:
+        if data:
             for val in data.values():
                 assert isinstance(val, MonthlyCollection), 'monthly_ground_temperature' \
                     ' must contain MonthlyCollection objects. Got {}.'.format(type(val))
@@ -479,21 +506,26 @@ class EPW(object):
         if not self.is_header_loaded:
             self._import_data(import_header_only=True)
 
+    def _load_climate_check(self):
+        """Check if the climate data of the header is parsed and, if not parse it."""
+        if not self._is_climate_loaded:
+            self._load_header_check()
+            self._import_climate_data()
+
     def _des_dict_check(self, des_dict, req_keys, cond_name):
         """Check if an input design condition dictionary is acceptable."""
         assert isinstance(des_dict, dict), '{}' \
             ' must be a dictionary. Got {}.'.format(cond_name, type(des_dict))
-        if bool(des_dict) is True:
-            input_keys = list(des_dict.keys())
+        if des_dict:
             for key in req_keys:
-                assert key in input_keys, 'Required key "{}" was not found in ' \
+                assert key in des_dict, 'Required key "{}" was not found in ' \
                     '{}'.format(key, cond_name)
 
     def _weeks_check(self, data, week_type):
         """Check if input for the typical/extreme weeks of the header is correct."""
         assert isinstance(data, dict), '{}' \
             ' must be an OrderedDict. Got {}.'.format(week_type, type(data))
-        if bool(data) is True:
+        if data:
             for val in data.values():
                 assert isinstance(val, AnalysisPeriod), '{} dictionary must contain' \
                     ' AnalysisPeriod objects. Got {}.'.format(week_type, type(val))
@@ -513,85 +545,32 @@ class EPW(object):
         assert self._file_path.lower().endswith('epw'), '{} is not an .epw file. \n' \
             'It does not possess the .epw file extension.'.format(self._file_path)
 
-        with open(self._file_path, readmode) as epwin:
-            line = epwin.readline()
-            original_header_load = bool(self._is_header_loaded)
-
+        with open(self._file_path, 'rb') as epwin:
             if not self._is_header_loaded:
+                line = _decode(epwin.readline())
                 # import location data
                 # first line has location data - Here is an example
                 # LOCATION,Denver Golden Nr,CO,USA,TMY3,724666,39.74,-105.18,-7.0,1829.0
                 location_data = line.strip().split(',')
-                self._location = Location()
-                self._location.city = location_data[1].replace('\\', ' ') \
-                    .replace('/', ' ')
-                self._location.state = location_data[2]
-                self._location.country = location_data[3]
-                self._location.source = location_data[4]
-                self._location.station_id = location_data[5]
-                self._location.latitude = location_data[6]
-                self._location.longitude = location_data[7]
-                self._location.time_zone = location_data[8]
-                self._location.elevation = location_data[9]
+                if len(location_data) < 10:
+                    raise ValueError(
+                        'The LOCATION line of the epw file {} has {} fields but 10 '
+                        'were expected:\n{}'.format(
+                            self._file_path, len(location_data), line.strip()))
+                _, city, state, country, source, station_id, lat, lon, tz, elev = \
+                    location_data[:10]
+                city = city.replace('\\', ' ').replace('/', ' ')
+                self._location = loc = Location(
+                    latitude=lat, longitude=lon, time_zone=tz, elevation=elev)
+                # text fields are kept as they are so that empty ones are written back
+                loc.city, loc.state, loc.country = city, state, country
+                loc.source, loc.station_id = source, station_id
 
                 # asemble a dictionary of metadata
-                self._metadata = {
-                    'source': self._location.source,
-                    'country': self._location.country,
-                    'city': self._location.city
-                }
-
-                self._header = [line] + [epwin.readline() for i in xrange(7)]
-
-                # parse the heating, cooling and extreme design conditions.
-                dday_data = self._header[1].strip().split(',')
-                if len(dday_data) >= 2 and int(dday_data[1]) == 1:
-                    if dday_data[4] == 'Heating':
-                        for key, val in zip(DesignDay.heating_keys, dday_data[5:20]):
-                            self._heating_dict[key] = val
-                    if dday_data[20] == 'Cooling':
-                        for key, val in zip(DesignDay.cooling_keys, dday_data[21:53]):
-                            self._cooling_dict[key] = val
-                    if dday_data[53] == 'Extremes':
-                        for key, val in zip(DesignDay.extreme_keys, dday_data[54:70]):
-                            self._extremes_dict[key] = val
-
-                # parse typical and extreme periods into analysis periods.
-                week_data = self._header[2].split(',')
-                num_weeks = int(week_data[1]) if len(week_data) >= 2 else 0
-                st_ind = 2
-                for i in xrange(num_weeks):
-                    week_dat = week_data[st_ind:st_ind + 4]
-                    st_ind += 4
-                    st = [int(num) for num in week_dat[2].split('/')]
-                    end = [int(num) for num in week_dat[3].split('/')]
-                    if len(st) == 3:
-                        a_per = AnalysisPeriod(st[1], st[2], 0, end[1], end[2], 23)
-                    elif len(st) == 2:
-                        a_per = AnalysisPeriod(st[0], st[1], 0, end[0], end[1], 23)
-                    if 'Max' in week_dat[0] and week_dat[1] == 'Extreme':
-                        self._extreme_hot_weeks[week_dat[0]] = a_per
-                    elif 'Min' in week_dat[0] and week_dat[1] == 'Extreme':
-                        self._extreme_cold_weeks[week_dat[0]] = a_per
-                    elif week_dat[1] == 'Typical':
-                        self._typical_weeks[week_dat[0]] = a_per
-
-                # parse the monthly ground temperatures in the header.
-                grnd_data = self._header[3].strip().split(',')
-                num_depths = int(grnd_data[1]) if len(grnd_data) >= 2 else 0
-                st_ind = 2
-                for i in xrange(num_depths):
-                    header_meta = dict(self._metadata)  # copying the metadata dictionary
-                    header_meta['depth'] = float(grnd_data[st_ind])
-                    header_meta['soil conductivity'] = grnd_data[st_ind + 1]
-                    header_meta['soil density'] = grnd_data[st_ind + 2]
-                    header_meta['soil specific heat'] = grnd_data[st_ind + 3]
-                    grnd_header = Header(temperature.GroundTemperature(), 'C',
-                                         AnalysisPeriod(), header_meta)
-                    grnd_vlas = [float(x) for x in grnd_data[st_ind + 4: st_ind + 16]]
-                    self._monthly_ground_temps[float(grnd_data[st_ind])] = \
-                        MonthlyCollection(grnd_header, grnd_vlas, list(xrange(12)))
-                    st_ind += 16
+                self._metadata = {'source': source, 'country': country, 'city': city}
+
+                self._header = [line] + [_decode(epwin.readline()) for i in xrange(7)]
+                self._data_offset = epwin.tell()  # position of the first line of data
 
                 # parse leap year, daylight savings and comments.
                 leap_dl_sav = self._header[4].strip().split(',')
@@ -611,84 +590,144 @@ class EPW(object):
                 return
 
             # read first line of data to overwrite the number of fields
-            if original_header_load is True:
-                for i in xrange(7):
-                    epwin.readline()
+            epwin.seek(self._data_offset)
             line = epwin.readline()
-            self._num_of_fields = min(len(line.strip().split(',')), 35)
-
-            # create an annual analysis period
-            analysis_period = AnalysisPeriod(is_leap_year=self.is_leap_year)
-
-            # create headers and an empty list for each field in epw file
-            headers = []
-            for field_number in xrange(self._num_of_fields):
-                field = EPWFields.field_by_number(field_number)
-                header = Header(data_type=field.name, unit=field.unit,
-                                analysis_period=analysis_period,
-                                metadata=dict(self._metadata))
-                headers.append(header)
-                self._data.append([])
-
-            # collect hourly data
-            while line:
-                data = line.strip().split(',')
-
-                for field_number in xrange(self._num_of_fields):
-                    value_type = EPWFields.field_by_number(field_number).value_type
-                    try:
-                        value = value_type(data[field_number])
-                    except ValueError as e:
-                        # failed to convert the value for the specific TypeError
-                        if value_type != int:
-                            raise ValueError(e)
-                        value = int(round(float(data[field_number])))
-
-                    self._data[field_number].append(value)
-
-                line = epwin.readline()
-
-            # if the first value is at 1 AM, move last item to start position
-            for field_number in xrange(self._num_of_fields):
-                point_in_time = headers[field_number].data_type.point_in_time
-                if point_in_time is True:
-                    # move the last hour to first position
-                    last_hour = self._data[field_number].pop()
-                    self._data[field_number].insert(0, last_hour)
-
-            # finally, build the data collection objects from the headers and data
-            for i in xrange(self._num_of_fields):
-                self._data[i] = HourlyContinuousCollection(headers[i], self._data[i])
+            self._num_of_fields = min(len(line.strip().split(b',')), 35)
+
+            # collect hourly data as bytes, which int() and float() accept directly
+            lines = epwin.read().splitlines()
+            rows = [line.strip().split(b',')]
+            rows.extend([ln.strip().split(b',') for ln in lines if ln])
+
+            # zip() would silently truncate all columns to the shortest row
+            if min(map(len, rows)) < self._num_of_fields:
+                for i, ln in enumerate(lines, 10):  # 8 header lines and the first row
+                    row_len = len(ln.strip().split(b','))
+                    if ln and row_len < self._num_of_fields:
+                        raise ValueError(
+                            'Line {} of the epw file {} has {} values but {} were '
+                            'expected.'.format(i, self._file_path, row_len,
+                                               self._num_of_fields))
+
+            # keep the raw values of each field (column) until the field is accessed
+            self._raw_columns = list(zip(*rows))[:self._num_of_fields]
+            self._data = [None] * self._num_of_fields
+            self._analysis_period = AnalysisPeriod(is_leap_year=self.is_leap_year)
 
             self._is_data_loaded = True
 
+    def _import_field(self, field_number):
+        """Convert the raw values of a field into a data collection and store it."""
+        field = EPWFields.field_by_number(field_number)
+        column = self._raw_columns[field_number]
+        value_type = field.value_type if field.value_type is not str else _decode
+        try:
+            values = list(map(value_type, column))
+        except ValueError as e:
+            # integer fields are sometimes written with decimals
+            if value_type is not int:
+                raise ValueError(e)
+            values = list(map(_int_or_round, column))
+
+        header = Header(data_type=field.name, unit=field.unit,
+                        analysis_period=self._analysis_period,
+                        metadata=dict(self._metadata))
+        if header.data_type.point_in_time is True:
+            # the first value is at 1 AM, so move the last item to the start position
+            values = values[-1:] + values[:-1]
+
+        data_c = HourlyContinuousCollection(header, values)
+        self._data[field_number] = data_c
+        self._raw_columns[field_number] = None
+        return data_c
+
+    def _import_all_fields(self):
+        """Import the data and make sure that every field is a data collection."""
+        if not self._is_data_loaded:
+            self._import_data()
+        for field_number, data_c in enumerate(self._data):
+            if data_c is None:
+                self._import_field(field_number)
+
+    def _import_climate_data(self):
+        """Import the design conditions, typical/extreme weeks and ground temperatures.
+
+        These are parsed from the raw header lines only once one of the properties
+        that uses them is accessed, which keeps location-only workflows fast.
+        """
+        # parse the heating, cooling and extreme design conditions.
+        dday_data = self._header[1].strip().split(',')
+        if len(dday_data) >= 2 and int(dday_data[1]) == 1:
+            if dday_data[4] == 'Heating':
+                self._heating_dict.update(zip(_HEATING_KEYS, dday_data[5:20]))
+            if dday_data[20] == 'Cooling':
+                self._cooling_dict.update(zip(_COOLING_KEYS, dday_data[21:53]))
+            if dday_data[53] == 'Extremes':
+                self._extremes_dict.update(zip(_EXTREME_KEYS, dday_data[54:70]))
+
+        # parse typical and extreme periods into analysis periods.
+        week_data = self._header[2].split(',')
+        num_weeks = int(week_data[1]) if len(week_data) >= 2 else 0
+        st_ind = 2
+        for i in xrange(num_weeks):
+            week_dat = week_data[st_ind:st_ind + 4]
+            st_ind += 4
+            st = [int(num) for num in week_dat[2].split('/')]
+            end = [int(num) for num in week_dat[3].split('/')]
+            if len(st) == 3:
+                a_per = AnalysisPeriod(st[1], st[2], 0, end[1], end[2], 23)
+            elif len(st) == 2:
+                a_per = AnalysisPeriod(st[0], st[1], 0, end[0], end[1], 23)
+            if 'Max' in week_dat[0] and week_dat[1] == 'Extreme':
+                self._extreme_hot_weeks[week_dat[0]] = a_per
+            elif 'Min' in week_dat[0] and week_dat[1] == 'Extreme':
+                self._extreme_cold_weeks[week_dat[0]] = a_per
+            elif week_dat[1] == 'Typical':
+                self._typical_weeks[week_dat[0]] = a_per
+
+        # parse the monthly ground temperatures in the header.
+        grnd_data = self._header[3].strip().split(',')
+        num_depths = int(grnd_data[1]) if len(grnd_data) >= 2 else 0
+        st_ind = 2
+        for i in xrange(num_depths):
+            header_meta = dict(self._metadata)  # copying the metadata dictionary
+            header_meta['depth'] = float(grnd_data[st_ind])
+            header_meta['soil conductivity'] = grnd_data[st_ind + 1]
+            header_meta['soil density'] = grnd_data[st_ind + 2]
+            header_meta['soil specific heat'] = grnd_data[st_ind + 3]
+            grnd_header = Header(temperature.GroundTemperature(), 'C',
+                                 AnalysisPeriod(), header_meta)
+            grnd_vlas = [float(x) for x in grnd_data[st_ind + 4: st_ind + 16]]
+            self._monthly_ground_temps[float(grnd_data[st_ind])] = \
+                MonthlyCollection(grnd_header, grnd_vlas, list(xrange(12)))
+            st_ind += 16
+
+        self._is_climate_loaded = True
+
     @property
     def header(self):
         """A list of text representing the full header (the first 8 lines) of the EPW."""
-        self._load_header_check()
+        self._load_climate_check()
         loc = self.location
         loc_str = 'LOCATION,{},{},{},{},{},{},{},{},{}\n'.format(
             loc.city, loc.state, loc.country, loc.source, loc.station_id, loc.latitude,
             loc.longitude, loc.time_zone, loc.elevation)
-        winter_found = bool(self._heating_dict)
-        summer_found = bool(self._cooling_dict)
-        extreme_found = bool(self._extremes_dict)
-        if winter_found and summer_found and extreme_found:
+        if self._heating_dict and self._cooling_dict and self._extremes_dict:
             des_str = 'DESIGN CONDITIONS,1,Climate Design Data 2009 ASHRAE Handbook,,'
             des_str = des_str + 'Heating,{},Cooling,{},Extremes,{}\n'.format(
-                ','.join([self._heating_dict[key] for key in DesignDay.heating_keys]),
-                ','.join([self._cooling_dict[key] for key in DesignDay.cooling_keys]),
-                ','.join([self._extremes_dict[key] for key in DesignDay.extreme_keys]))
+                ','.join(_HEATING_VALUES(self._heating_dict)),
+                ','.join(_COOLING_VALUES(self._cooling_dict)),
+                ','.join(_EXTREME_VALUES(self._extremes_dict)))
         else:
             des_str = 'DESIGN CONDITIONS,0\n'
         weeks = []
-        if bool(self.extreme_hot_weeks) is True:
+        if self.extreme_hot_weeks:
             for wk_name, a_per in self.extreme_hot_weeks.items():
                 weeks.append(self._format_week(wk_name, 'Extreme', a_per))
-        if bool(self.extreme_cold_weeks):
+        if self.extreme_cold_weeks:
             for wk_name, a_per in self.extreme_cold_weeks.items():
                 weeks.append(self._format_week(wk_name, 'Extreme', a_per))
-        if bool(self.typical_weeks):
+        if self.typical_weeks:
             for wk_name in sorted(self.typical_weeks.keys()):
                 a_per = self.typical_weeks[wk_name]
                 weeks.append(self._format_week(wk_name, 'Typical', a_per))
@@ -708,17 +747,16 @@ class EPW(object):
 
     def _format_week(self, name, type, a_per):
         """Format an AnalysisPeriod into string for the EPW header."""
-        return '{},{},{}/{},{}/{}'.format(name, type, a_per.st_month, a_per.st_day,
-                                          a_per.end_month, a_per.end_day)
+        return '%s,%s,%s/%s,%s/%s' % (name, type, a_per.st_month, a_per.st_day,
+                                      a_per.end_month, a_per.end_day)
 
     def _format_grndt(self, data_c):
         """Format monthly ground data collection into string for the EPW header."""
-        monthly_str = '{},{},{},{}'.format(
-            data_c.header.metadata['soil conductivity'],
-            data_c.header.metadata['soil density'],
-            data_c.header.metadata['soil specific heat'],
-            ','.join(['%.2f' % x for x in data_c.values]))
-        return monthly_str
+        meta = data_c.header.metadata
+        values = data_c.values
+        grnd_template = '%s,%s,%s,' + ','.join(['%.2f'] * len(values))
+        return grnd_template % ((meta['soil conductivity'], meta['soil density'],
+                                 meta['soil specific heat']) + values)
 
     def save(self, file_path):
         """Save epw object as an epw file.
@@ -726,49 +764,29 @@ class EPW(object):
         args:
             file_path: A string representing the path to write the epw file to.
         """
-        # load data if it's  not loaded convert to SI if it is in IP
-        if not self.is_data_loaded:
-            self._import_data()
-        originally_ip = False
-        if self.is_ip is True:
-            self.convert_to_si()
-            originally_ip = True
-
-        # write the file
-        lines = self.header
-        try:
-            # if the first value is at 1AM, move first item to end position
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time is True:
-                    first_hour = self._data[field]._values.pop(0)
-                    self._data[field]._values.append(first_hour)
-
-            annual_a_per = AnalysisPeriod(is_leap_year=self.is_leap_year)
-            for hour in xrange(0, len(annual_a_per.datetimes)):
-                line = []
-                for field in xrange(0, self._num_of_fields):
-                    line.append(str(self._data[field]._values[hour]))
-                lines.append(",".join(line) + "\n")
-        except IndexError:
-            # cleaning up
-            length_error_msg = 'Data length is not for a full year and cannot be ' + \
-                'saved as an EPW file.'
-            raise ValueError(length_error_msg)
-        else:
-            file_data = ''.join(lines)
-            write_to_file(file_path, file_data, True)
-        finally:
-            del(lines)
-            # move last item to start position for fields on the hour
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time is True:
-                    last_hour = self._data[field]._values.pop()
-                    self._data[field]._values.insert(0, last_hour)
-
-        if originally_ip is True:
-            self.convert_to_ip()
+        # load data if it's not loaded
+        self._import_all_fields()
+
+        # collect the values of each field (column) in the order they are written
+        hours = 8784 if self.is_leap_year else 8760
+        columns = []
+        for data_c in self._data:
+            header, values = data_c.header, data_c._values
+            if len(values) < hours:
+                raise ValueError('Data length is not for a full year and cannot '
+                                 'be saved as an EPW file.')
+            if self._is_ip:
+                # write SI values without converting the collection back and forth
+                values = header.data_type.to_si(values, header.unit)[0]
+            if header.data_type.point_in_time is True:
+                # the first value is at 1AM, so move the first item to the end
+                values = values[1:hours] + values[:1]
+            columns.append(values[:hours])
+
+        # write the header and then stream the rows of data to the file
+        row_template = ','.join(['%s'] * len(columns)) + '\n'
+        rows = (row_template % row for row in zip(*columns))
+        write_lines_to_file(file_path, chain(self.header, rows), True)
 
         return file_path
 
@@ -777,8 +795,7 @@ class EPW(object):
 
         This is useful when one knows that all graphics produced from this
         EPW should be in Imperial units."""
-        if not self.is_data_loaded:
-            self._import_data()
+        self._import_all_fields()
         if self.is_ip is False:
             for coll in self._data:
                 coll.convert_to_ip()
@@ -790,13 +807,17 @@ class EPW(object):
         This is useful when one needs to convert the EPW back to SI units
         from imperial units for processes like computing thermal comfort
         from EPW data."""
-        if not self.is_data_loaded:
-            self._import_data()
+        self._import_all_fields()
         if self.is_ip is True:
             for coll in self._data:
                 coll.convert_to_si()
         self._is_ip = False
 
+    def _average_station_pressure(self):
+        """Get the average atmospheric station pressure or None if it is missing."""
+        avg_press = self.atmospheric_station_pressure.average
+        return None if avg_press == 999999 else avg_press
+
     def _get_data_by_field(self, field_number):
         """Return a data field by field number.
 
@@ -810,14 +831,15 @@ class EPW(object):
         Returns:
             An annual Ladybug list
         """
-        if not self.is_data_loaded:
+        if not self._is_data_loaded:
             self._import_data()
 
         # check input data
         if not 0 <= field_number < self._num_of_fields:
             raise ValueError("Field number should be between 0-%d" % self._num_of_fields)
 
-        return self._data[field_number]
+        data_c = self._data[field_number]
+        return data_c if data_c is not None else self._import_field(field_number)
 
     def import_data_by_field(self, field_number):
         """Return an annual data collection for any field_number in epw file.
@@ -1287,17 +1309,16 @@ class EPW(object):
                                  metadata=self._metadata)
 
         # calculate sy temperature for each hour
-        horiz_ir = self._get_data_by_field(12).values
-        sky_temp_data = [calc_sky_temperature(hir) for hir in horiz_ir]
+        horiz_ir = self._get_data_by_field(12)._values
+        sky_temp_data = calc_sky_temperatures(horiz_ir)
         return HourlyContinuousCollection(sky_temp_header, sky_temp_data)
 
     def _get_wea_header(self):
-        return "place %s\n" % self.location.city + \
-            "latitude %.2f\n" % self.location.latitude + \
-            "longitude %.2f\n" % -self.location.longitude + \
-            "time_zone %d\n" % (-self.location.time_zone * 15) + \
-            "site_elevation %.1f\n" % self.location.elevation + \
-            "weather_data_file_unit 1\n"
+        loc = self.location
+        return "place %s\nlatitude %.2f\nlongitude %.2f\ntime_zone %d\n" \
+            "site_elevation %.1f\nweather_data_file_unit 1\n" % (
+                loc.city, loc.latitude, -loc.longitude, -loc.time_zone * 15,
+                loc.elevation)
 
     def to_wea(self, file_path, hoys=None):
         """Write an wea file from the epw file.
@@ -1313,61 +1334,47 @@ class EPW(object):
         if not file_path.lower().endswith('.wea'):
             file_path += '.wea'
 
-        originally_ip = False
-        if self.is_ip is True:
-            self.convert_to_si()
-            originally_ip = True
+        # get the radiation values in SI without converting the collections
+        dnr, dhr = self.direct_normal_radiation, self.diffuse_horizontal_radiation
+        dir_rad, dif_rad = dnr._values, dhr._values
+        if self._is_ip:
+            dir_rad = dnr.header.data_type.to_si(dir_rad, dnr.header.unit)[0]
+            dif_rad = dhr.header.data_type.to_si(dif_rad, dhr.header.unit)[0]
 
-        # write header
+        # build all of the lines before opening the file so that an invalid hoy
+        # fails before anything is written
+        datetimes = dnr.datetimes
         lines = [self._get_wea_header()]
-        # write values
-        datetimes = self.direct_normal_radiation.datetimes
-        for hoy in hoys:
-            dir_rad = self.direct_normal_radiation[hoy]
-            dif_rad = self.diffuse_horizontal_radiation[hoy]
-            line = "%d %d %.3f %d %d\n" \
-                % (datetimes[hoy].month,
-                   datetimes[hoy].day,
-                   datetimes[hoy].hour + 0.5,
-                   dir_rad, dif_rad)
-            lines.append(line)
-
-        file_data = ''.join(lines)
-        write_to_file(file_path, file_data, True)
-
-        if originally_ip is True:
-            self.convert_to_ip()
+        lines.extend("%d %d %.3f %d %d\n" % (datetimes[hoy].month, datetimes[hoy].day,
+                                             datetimes[hoy].hour + 0.5,
+                                             dir_rad[hoy], dif_rad[hoy])
+                     for hoy in hoys)
+        write_lines_to_file(file_path, lines, True)
 
         return file_path
 
     def to_dict(self):
         """Convert the EPW to a dictionary."""
-        # load data if it's not loaded
-        if not self.is_data_loaded:
-            self._import_data()
+        # load data and the climate data of the header if they are not loaded
+        self._import_all_fields()
+        self._load_climate_check()
 
         def dictify_dict(base_dict):
-            new_dict = {}
-            for key, val in base_dict.items():
-                new_dict[key] = val.to_dict()
-            return new_dict
-        hot_wks = dictify_dict(self.extreme_hot_weeks)
-        cold_wks = dictify_dict(self.extreme_cold_weeks)
-        typ_wks = dictify_dict(self.typical_weeks)
-        grnd_temps = dictify_dict(self.monthly_ground_temperature)
+            return {key: val.to_dict() for key, val in base_dict.items()}
+
         return {
-            'location': self.location.to_dict(),
+            'location': self._location.to_dict(),
             'data_collections': [dc.to_dict() for dc in self._data],
-            'metadata': self.metadata,
-            'heating_dict': self.heating_design_condition_dictionary,
-            'cooling_dict': self.cooling_design_condition_dictionary,
-            'extremes_dict': self.extreme_design_condition_dictionary,
-            'extreme_hot_weeks': hot_wks,
-            'extreme_cold_weeks': cold_wks,
-            'typical_weeks': typ_wks,
-            "monthly_ground_temps": grnd_temps,
+            'metadata': self._metadata,
+            'heating_dict': self._heating_dict,
+            'cooling_dict': self._cooling_dict,
+            'extremes_dict': self._extremes_dict,
+            'extreme_hot_weeks': dictify_dict(self._extreme_hot_weeks),
+            'extreme_cold_weeks': dictify_dict(self._extreme_cold_weeks),
+            'typical_weeks': dictify_dict(self._typical_weeks),
+            "monthly_ground_temps": dictify_dict(self._monthly_ground_temps),
             "is_ip": self._is_ip,
-            "is_leap_year": self.is_leap_year,
+            "is_leap_year": self._is_leap_year,
             "daylight_savings_start": self.daylight_savings_start,
             "daylight_savings_end": self.daylight_savings_end,
             "comments_1": self.comments_1,
@@ -1624,10 +1631,16 @@ class EPWFields(object):
              }
     }
 
+    _fields = None  # EPWField instances built from FIELDS on first request
+    _repr = None  # text of __repr__, built on the first call
+
     @classmethod
     def field_by_number(cls, field_number):
         """Return an EPWField based on field number.
 
+        The same EPWField instance is returned every time a field is requested
+        and it should not be edited.
+
         0 Year
         1 Month
         2 Day
@@ -1664,16 +1677,18 @@ class EPWFields(object):
         33 Liquid Precipitation Depth
         34 Liquid Precipitation Quantity
         """
-        return EPWField(cls.FIELDS[field_number])
+        if cls._fields is None:
+            cls._fields = {key: EPWField(value) for key, value in cls.FIELDS.items()}
+        return cls._fields[field_number]
 
     def __repr__(self):
         """EPW fields representation."""
-        fields = (
-            '{}: {}'.format(key, value['name'])
-            for key, value in self.FIELDS.items()
-        )
-
-        return '\n'.join(fields)
+        if EPWFields._repr is None:
+            EPWFields._repr = '\n'.join(
+                '{}: {}'.format(key, value['name'])
+                for key, value in self.FIELDS.items()
+            )
+        return EPWFields._repr
 
 
 class EPWField(object):
@@ -1686,14 +1701,10 @@ class EPWField(object):
         missing: Missing value for the data type in EPW files.
     """
 
+    __slots__ = ('name', 'value_type', 'unit', 'missing')
+
     def __init__(self, field_dict):
         self.name = field_dict['name']
         self.value_type = field_dict['type']
-        if 'unit' in field_dict:
-            self.unit = field_dict['unit']
-        else:
-            self.unit = None
-        if 'missing' in field_dict:
-            self.missing = field_dict['missing']
-        else:
-            self.missing = None
+        self.unit = field_dict.get('unit')
+        self.missing = field_dict.get('missing')
@@ -4,6 +4,7 @@ from __future__ import division
 
 import os
 import shutil
+import tempfile
 import zipfile
 import sys
 
@@ -78,14 +79,7 @@ def write_to_file_by_name(folder, fname, data, mkdir=False):
         data: Any data as string.
         mkdir: Set to True to create the directory if doesn't exist (Default: False).
     """
-    if not os.path.isdir(folder):
-        if mkdir:
-            preparedir(folder)
-        else:
-            created = preparedir(folder, False)
-            if not created:
-                raise ValueError("Failed to find %s." % folder)
-
+    _check_folder(folder, mkdir)
     file_path = os.path.join(folder, fname)
 
     with open(file_path, writemode) as outf:
@@ -108,6 +102,75 @@ def write_to_file(file_path, data, mkdir=False):
     return write_to_file_by_name(folder, fname, data, mkdir)
 
 
+def write_lines_to_file(file_path, lines, mkdir=False):
+    """Write an iterable of strings to file without joining them into one string.
+
+    Args:
+        file_path: Full path for a valid file path (e.g. c:/ladybug/testPts.pts)
+        lines: An iterable of strings, each of which should end with a line break.
+        mkdir: Set to True to create the directory if doesn't exist (Default: False)
+    """
+    folder, fname = os.path.split(file_path)
+    _check_folder(folder, mkdir)
+
+    # write to a temporary file and only move it over the target once every line
+    # has been written so that an error while generating lines leaves no partial file
+    fd, temp_path = tempfile.mkstemp(
+        suffix='.tmp', prefix=fname + '.', dir=folder or os.curdir)
+    keep_temp = False
+    try:
+        # use a 1 MB buffer so that many short lines are written in few system calls
+        with os.fdopen(fd, writemode, 1048576) as outf:
+            try:
+                outf.writelines(lines)
+            except (IOError, OSError) as e:
+                raise IOError("Failed to write %s to file:\n\t%s" % (fname, str(e)))
+        _copy_file_mode(file_path, temp_path)
+        if hasattr(os, 'replace'):  # python 3
+            os.replace(temp_path, file_path)
+        else:
+            try:
+                os.rename(temp_path, file_path)  # overwrites file_path on Unix
+            except OSError:  # Windows does not rename over an existing file
+                if not os.path.isfile(file_path):
+                    raise
+                os.remove(file_path)
+                keep_temp = True  # the new output is all that is left from here
+                try:
+                    os.rename(temp_path, file_path)
+                except OSError as e:
+                    raise IOError("Failed to move %s to %s:\n\t%s" % (
+                        temp_path, file_path, str(e)))
+    finally:
+        if not keep_temp and os.path.isfile(temp_path):
+            os.remove(temp_path)
+    return file_path
+
+
+def _copy_file_mode(file_path, temp_path):
+    """Give a temporary file the permissions that file_path has or would be given.
+
+    mkstemp creates files that only the owner can read and write.
+    """
+    if os.path.isfile(file_path):
+        shutil.copymode(file_path, temp_path)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+
+
+def _check_folder(folder, mkdir):
+    """Check that a folder exists and create it if mkdir is True."""
+    if not os.path.isdir(folder):
+        if mkdir:
+            preparedir(folder)
+        else:
+            created = preparedir(folder, False)
+            if not created:
+                raise ValueError("Failed to find %s." % folder)
+
+
 def copy_files_to_folder(files, target_folder, overwrite=True):
     """Copy a list of files to a new target folder.
 
@@ -25,6 +25,9 @@ class GraphicContainer(object):
         upper_title_location
     """
 
+    __slots__ = ('_legend', '_min_point', '_max_point', '_data_type', '_unit',
+                 '_lower_title', '_upper_title')
+
     def __init__(self, values, min_point, max_point,
                  legend_parameters=None, data_type=None, unit=None):
         """Initialize graphic container.
@@ -48,8 +51,11 @@ class GraphicContainer(object):
         assert isinstance(max_point, Point3D), \
             'max_point should be a ladybug Point3D. Got {}'.format(type(max_point))
         self._legend = Legend(values, legend_parameters)
+        legend_par = self._legend._legend_par
         self._min_point = min_point
         self._max_point = max_point
+        self._lower_title = None  # (text_height, Plane) of the last title request
+        self._upper_title = None
 
         # set default legend parameters based on input data_type and unit
         self._data_type = data_type
@@ -58,53 +64,53 @@ class GraphicContainer(object):
             # TODO: Have data types reference Colorsets, which override default colors
             assert isinstance(data_type, DataTypeBase), \
                 'data_type should be a ladybug DataType. Got {}'.format(type(data_type))
-            if self.legend_parameters.is_title_default:
+            if legend_par.is_title_default:
                 unit = data_type.units[0] if unit is None else unit
                 data_type.is_unit_acceptable(unit)
-                self.legend_parameters.title = unit if \
-                    self.legend_parameters.vertical is True \
+                legend_par.title = unit if legend_par.vertical is True \
                     else '{} ({})'.format(data_type.name, unit)
             if data_type.unit_descr is not None and \
-                    self.legend_parameters.ordinal_dictionary is None:
-                self.legend_parameters.ordinal_dictionary = data_type.unit_descr
-                sorted_keys = sorted(data_type.unit_descr.keys())
-                if self.legend.is_min_default is True:
-                    self.legend_parameters.min = sorted_keys[0]
-                if self.legend.is_max_default is True:
-                    self.legend_parameters.max = sorted_keys[-1]
-                if self.legend_parameters.is_segment_count_default:
-                    try:  # try to set the number of segments to align with ordinal text
-                        min_i = sorted_keys.index(self.legend_parameters.min)
-                        max_i = sorted_keys.index(self.legend_parameters.max)
-                        self.legend_parameters.segment_count = \
-                            len(sorted_keys[min_i:max_i + 1])
-                    except IndexError:
-                        pass
-        elif unit is not None and self.legend_parameters.is_title_default:
+                    legend_par.ordinal_dictionary is None:
+                legend_par.ordinal_dictionary = data_type.unit_descr
+                is_min_default = self._legend.is_min_default is True
+                is_max_default = self._legend.is_max_default is True
+                if is_min_default or is_max_default or \
+                        legend_par.is_segment_count_default:
+                    sorted_keys = sorted(data_type.unit_descr.keys())
+                    if is_min_default:
+                        legend_par.min = sorted_keys[0]
+                    if is_max_default:
+                        legend_par.max = sorted_keys[-1]
+                    if legend_par.is_segment_count_default:
+                        key_i = {key: i for i, key in enumerate(sorted_keys)}
+                        try:  # try to align the number of segments with ordinal text
+                            min_i = key_i[legend_par.min]
+                            max_i = key_i[legend_par.max]
+                            legend_par.segment_count = len(sorted_keys[min_i:max_i + 1])
+                        except KeyError:  # min or max is not one of the ordinal keys
+                            pass
+        elif unit is not None and legend_par.is_title_default:
             assert isinstance(unit, str), \
                 'Expected string for unit. Got {}.'.format(type(unit))
-            self.legend_parameters.title = unit
+            legend_par.title = unit
 
         # set the default segment_height
-        if self.legend_parameters.is_segment_height_default:
-            if self.legend_parameters.vertical:
-                seg_height = float((self._max_point.y - self._min_point.y) / 20)
+        min_x, min_y, min_z = min_point.x, min_point.y, min_point.z
+        max_x, max_y = max_point.x, max_point.y
+        if legend_par.is_segment_height_default:
+            if legend_par.vertical:
+                seg_height = float((max_y - min_y) / 20)
             else:
-                seg_height = float((self._max_point.x - self._min_point.x) / 20)
-            self.legend_parameters.segment_height = seg_height
+                seg_height = float((max_x - min_x) / 20)
+            legend_par.segment_height = seg_height
 
         # set the default base point
-        if self.legend_parameters.is_base_plane_default:
-            if self.legend_parameters.vertical:
-                base_pt = Point3D(
-                    self._max_point.x + self.legend_parameters.segment_width,
-                    self._min_point.y, self._min_point.z)
+        if legend_par.is_base_plane_default:
+            if legend_par.vertical:
+                base_pt = Point3D(max_x + legend_par.segment_width, min_y, min_z)
             else:
-                base_pt = Point3D(
-                    self._max_point.x, self._max_point.y +
-                    3 * self.legend_parameters.text_height,
-                    self._min_point.z)
-            self.legend_parameters.base_plane = Plane(o=base_pt)
+                base_pt = Point3D(max_x, max_y + 3 * legend_par.text_height, min_z)
+            legend_par.base_plane = Plane(o=base_pt)
 
     @classmethod
     def from_dict(cls, data):
@@ -177,18 +183,22 @@ class GraphicContainer(object):
     @property
     def lower_title_location(self):
         """A Plane for the lower location of title text."""
-        return Plane(o=Point3D(
-            self._min_point.x,
-            self._min_point.y - 2.5 * self._legend.legend_parameters.text_height,
-            self._min_point.z))
+        txt_h = self._legend._legend_par.text_height
+        if self._lower_title is None or self._lower_title[0] != txt_h:
+            min_pt = self._min_point
+            self._lower_title = (txt_h, Plane(
+                o=Point3D(min_pt.x, min_pt.y - 2.5 * txt_h, min_pt.z)))
+        return self._lower_title[1]
 
     @property
     def upper_title_location(self):
         """A Plane for the upper location of title text."""
-        return Plane(o=Point3D(
-            self._min_point.x,
-            self._max_point.y + self._legend.legend_parameters.text_height,
-            self._min_point.z))
+        txt_h = self._legend._legend_par.text_height
+        if self._upper_title is None or self._upper_title[0] != txt_h:
+            min_pt = self._min_point
+            self._upper_title = (txt_h, Plane(
+                o=Point3D(min_pt.x, self._max_point.y + txt_h, min_pt.z)))
+        return self._upper_title[1]
 
     def to_dict(self):
         """Get result graphic container as a dictionary."""
@@ -9,15 +9,21 @@ from ladybug_geometry.geometry3d.mesh import Mesh3D
 from ladybug_geometry.geometry2d.pointvector import Point2D
 from ladybug_geometry.geometry2d.mesh import Mesh2D
 
+from itertools import chain
 try:
-    from collections.abc import Iterable  # python < 3.7
+    from collections.abc import Iterable  # python 3
 except ImportError:
-    from collections import Iterable  # python >= 3.8
+    from collections import Iterable  # python 2 and IronPython
 import sys
 if (sys.version_info > (3, 0)):  # python 3
     xrange = range
 
 
+def _copy_colors(colors):
+    """Copy cached colors so that users cannot edit the colors shared by the cache."""
+    return tuple(col.duplicate() if col is not None else None for col in colors)
+
+
 class Legend(object):
     """Ladybug legend used to get legend geometry, legend text, generate colors, etc.
 
@@ -95,6 +101,9 @@ class Legend(object):
         >> ['Cool', 'Slightly Cool', 'Neutral', 'Slightly Warm', 'Warm']
     """
 
+    __slots__ = ('_values', '_cache', '_legend_par', '_is_min_default',
+                 '_is_max_default')
+
     def __init__(self, values, legend_parameters=None):
         """Initalize Ladybug Legend.
 
@@ -105,10 +114,13 @@ class Legend(object):
                 default parameters of the legend.
             """
         # check the inputs
-        assert isinstance(values, Iterable) \
-            and not isinstance(values, (str, dict, bytes, bytearray)), \
-            'values should be a list or tuple. Got {}'.format(type(values))
+        if not isinstance(values, (list, tuple)):
+            assert isinstance(values, Iterable) \
+                and not isinstance(values, (str, dict, bytes, bytearray)), \
+                'values should be a list or tuple. Got {}'.format(type(values))
+            values = list(values)  # generators can only be iterated once
         self._values = values
+        self._cache = {}  # derived properties as {name: (inputs, result)}
         if legend_parameters is not None:
             assert isinstance(legend_parameters, LegendParameters), \
                 'Expected LegendParameters. Got {}.'.format(type(legend_parameters))
@@ -139,18 +151,13 @@ class Legend(object):
             "values": (0, 10),
             "legend_parameters": None}
         """
-        if 'legend_parameters' not in data:
-            data['legend_parameters'] = None
         legend_parameters = None
-        if data['legend_parameters'] is not None:
+        if data.get('legend_parameters') is not None:
             legend_parameters = LegendParameters.from_dict(data['legend_parameters'])
-        for key in ('is_min_default', 'is_max_default'):
-            if key not in data:
-                data[key] = False
 
         legend = cls(data['values'], legend_parameters)
-        legend._is_min_default = data['is_min_default']
-        legend._is_max_default = data['is_max_default']
+        legend._is_min_default = data.get('is_min_default', False)
+        legend._is_max_default = data.get('is_max_default', False)
         return legend
 
     @property
@@ -166,8 +173,13 @@ class Legend(object):
     @property
     def value_colors(self):
         """A List of colors associated with the assigned values."""
-        _color_range = self.color_range
-        return tuple(_color_range.color(val) for val in self.values)
+        color_key = self._color_key()
+
+        def value_colors():
+            return tuple(map(self._shared_color_range(color_key).color, self._values))
+        # slicing snapshots a list of values so that edits to it are noticed
+        return _copy_colors(self._cached(
+            'value_colors', (color_key, self._values[:]), value_colors))
 
     @property
     def title(self):
@@ -203,13 +215,8 @@ class Legend(object):
                 seg_txt[-1] = '>' + seg_txt[-1]
             return seg_txt
         else:
-            seg_txt = []
-            for x in self.segment_numbers:
-                try:
-                    seg_txt.append(_l_par.ordinal_dictionary[x])
-                except KeyError:
-                    seg_txt.append('')
-        return seg_txt
+            _ord_dict = _l_par.ordinal_dictionary
+            return [_ord_dict.get(x, '') for x in self.segment_numbers]
 
     @property
     def segment_text_location(self):
@@ -249,16 +256,27 @@ class Legend(object):
 
     @property
     def segment_numbers(self):
-        _l_par = self.legend_parameters
-        _seg_stp = (_l_par.max - _l_par.min) / (_l_par.segment_count - 1)
-        return tuple(_l_par.min + i * _seg_stp
-                     for i in xrange(_l_par.segment_count))
+        """A tuple of the numbers at each of the legend segments."""
+        _l_par = self._legend_par
+        _min, _max, _seg_count = _l_par._min, _l_par._max, _l_par._segment_count
+
+        def segment_numbers():
+            _seg_stp = (_max - _min) / (_seg_count - 1)
+            return tuple(_min + i * _seg_stp for i in xrange(_seg_count))
+        return self._cached(
+            'segment_numbers', (_min, _max, _seg_count), segment_numbers)
 
     @property
     def segment_colors(self):
         """A List of colors associated with the legend segments."""
-        _color_range = self.color_range
-        return tuple(_color_range.color(val) for val in self.segment_numbers)
+        color_key = self._color_key()
+
+        def segment_colors():
+            return tuple(map(self._shared_color_range(color_key).color,
+                             self.segment_numbers))
+        return _copy_colors(self._cached(
+            'segment_colors', (color_key, self._legend_par.segment_count),
+            segment_colors))
 
     @property
     def segment_length(self):
@@ -299,11 +317,43 @@ class Legend(object):
             'type': 'Legend'
         }
 
+    def _color_key(self):
+        """Get the legend parameters that the colors of the legend depend on."""
+        _l_par = self._legend_par
+        return (tuple((col._r, col._g, col._b) for col in _l_par._colors),
+                _l_par._min, _l_par._max, _l_par._continuous_colors)
+
+    def _shared_color_range(self, color_key):
+        """Get a ColorRange shared by value_colors and segment_colors.
+
+        Unlike the color_range property, this ColorRange is never given to users
+        and so it can be reused for as long as the color_key does not change.
+        """
+        return self._cached('color_range', color_key, lambda: self.color_range)
+
+    def _cached(self, name, inputs, calculate):
+        """Get a derived property, only calculating it again if its inputs changed.
+
+        Args:
+            name: Text for the name of the derived property in the cache.
+            inputs: A tuple of everything that the property depends on.
+            calculate: A function with no arguments that returns the property.
+        """
+        try:
+            cached_inputs, result = self._cache[name]
+            if cached_inputs == inputs:
+                return result
+        except KeyError:
+            pass
+        result = calculate()
+        self._cache[name] = (inputs, result)
+        return result
+
     def _title_point_2d(self):
         """Point2D for the title in the 2D space of the legend."""
-        _l_par = self.legend_parameters
+        _l_par = self._legend_par
         if _l_par.vertical:
-            offset = 0.5 if self.legend_parameters.continuous_legend is True else 0.25
+            offset = 0.5 if _l_par.continuous_legend is True else 0.25
             return Point2D(0, _l_par.segment_height * (self.segment_length + offset))
         else:
             return Point2D(-_l_par.segment_width * self.segment_length,
@@ -311,53 +361,42 @@ class Legend(object):
 
     def _segment_point_2d(self):
         """Point2D for the segment text in the 2D space of the legend."""
-        _l_par = self.legend_parameters
+        _l_par = self._legend_par
+        seg_w, txt_h = _l_par.segment_width, _l_par.text_height
+        seg_count = _l_par.segment_count
         if _l_par.vertical:  # vertical
-            _pt_2d = tuple(
-                Point2D(_l_par.segment_width + _l_par.text_height * 0.25, i)
-                for i in Legend._frange(0, _l_par.segment_height *
-                                        _l_par.segment_count,
-                                        _l_par.segment_height))
+            seg_h, _x = _l_par.segment_height, seg_w + txt_h * 0.25
+            _pt_2d = tuple(Point2D(_x, seg_h * i) for i in xrange(seg_count))
         else:  # horizontal
-            _start_val = -_l_par.segment_width * self.segment_length
-            _pt_2d = tuple(
-                Point2D(_start_val + i, -_l_par.text_height * 1.25)
-                for i in Legend._frange(0, _l_par.segment_width *
-                                        _l_par.segment_count,
-                                        _l_par.segment_width))
+            _start_val, _y = -seg_w * self.segment_length, -txt_h * 1.25
+            _pt_2d = tuple(Point2D(_start_val + seg_w * i, _y)
+                           for i in xrange(seg_count))
         return _pt_2d
 
     def _segment_mesh_2d(self, base_pt=Point2D(0, 0)):
         """Mesh2D for the segments in the 2D space of the legend."""
         # get general properties
-        _l_par = self.legend_parameters
+        _l_par = self._legend_par
         n_seg = self.segment_length
+        seg_w, seg_h = _l_par.segment_width, _l_par.segment_height
+        vertical = _l_par.vertical
         # create the 2D mesh of the legend
-        if _l_par.vertical:
-            mesh2d = Mesh2D.from_grid(
-                base_pt, 1, n_seg, _l_par.segment_width, _l_par.segment_height)
+        if vertical:
+            mesh2d = Mesh2D.from_grid(base_pt, 1, n_seg, seg_w, seg_h)
         else:
-            _base_pt = Point2D(base_pt.x - _l_par.segment_width * n_seg, base_pt.y)
-            mesh2d = Mesh2D.from_grid(
-                _base_pt, n_seg, 1, _l_par.segment_width, _l_par.segment_height)
+            _base_pt = Point2D(base_pt.x - seg_w * n_seg, base_pt.y)
+            mesh2d = Mesh2D.from_grid(_base_pt, n_seg, 1, seg_w, seg_h)
         # add colors to the mesh
         _seg_colors = self.segment_colors
         if not _l_par.continuous_legend:
             mesh2d.colors = _seg_colors
         else:
-            if _l_par.vertical:
+            if vertical:
                 mesh2d.colors = _seg_colors + _seg_colors
             else:
-                mesh2d.colors = tuple(col for col in _seg_colors for i in (0, 1))
+                mesh2d.colors = tuple(chain.from_iterable(zip(_seg_colors, _seg_colors)))
         return mesh2d
 
-    @staticmethod
-    def _frange(start, stop, step):
-        """Range function capable of yielding float values."""
-        while start < stop:
-            yield start
-            start += step
-
     def __copy__(self):
         _leg = Legend(self.values, self.legend_parameters)
         _leg._is_min_default = self._is_min_default
@@ -422,6 +461,14 @@ class LegendParameters(object):
         lp.segment_width = 5
     """
 
+    __slots__ = ('_min', '_max', '_segment_count', '_colors', '_continuous_colors',
+                 '_continuous_legend', '_title', '_ordinal_dictionary',
+                 '_decimal_count', '_include_larger_smaller', '_vertical',
+                 '_base_plane', '_segment_height', '_segment_width', '_text_height',
+                 '_font', '_is_segment_count_default', '_is_title_default',
+                 '_is_base_plane_default', '_is_segment_height_default',
+                 '_is_segment_width_default', '_is_text_height_default')
+
     def __init__(self, min=None, max=None, segment_count=None,
                  colors=None, title=None, base_plane=None):
         """Initalize Ladybug Legend Parameters.
@@ -473,47 +520,32 @@ class LegendParameters(object):
             "max": 3,
             "segment_count": 7}
         """
-        optional_keys = ('min', 'max', 'segment_count',
-                         'colors', 'continuous_colors', 'continuous_legend',
-                         'title', 'ordinal_dictionary',
-                         'decimal_count', 'include_larger_smaller',
-                         'vertical', 'base_plane', 'segment_height',
-                         'segment_width', 'text_height', 'font')
-        default_keys = ('is_segment_count_default', 'is_title_default',
-                        'is_base_plane_default', 'is_segment_height_default',
-                        'is_segment_width_default', 'is_text_height_default')
-        for key in optional_keys:
-            if key not in data:
-                data[key] = None
-        for key in default_keys:
-            if key not in data:
-                data[key] = False
-
         colors = None
-        if data['colors'] is not None:
+        if data.get('colors') is not None:
             colors = [Color.from_dict(col) for col in data['colors']]
         base_plane = None
-        if data['base_plane'] is not None:
+        if data.get('base_plane') is not None:
             base_plane = Plane.from_dict(data['base_plane'])
 
-        leg_par = cls(data['min'], data['max'], data['segment_count'],
-                      colors, data['title'], base_plane)
-        leg_par.continuous_colors = data['continuous_colors']
-        leg_par.continuous_legend = data['continuous_legend']
-        leg_par.ordinal_dictionary = data['ordinal_dictionary']
-        leg_par.decimal_count = data['decimal_count']
-        leg_par.include_larger_smaller = data['include_larger_smaller']
-        leg_par.vertical = data['vertical']
-        leg_par.segment_height = data['segment_height']
-        leg_par.segment_width = data['segment_width']
-        leg_par.text_height = data['text_height']
-        leg_par.font = data['font']
-        leg_par._is_segment_count_default = data['is_segment_count_default']
-        leg_par._is_title_default = data['is_title_default']
-        leg_par._is_base_plane_default = data['is_base_plane_default']
-        leg_par._is_segment_height_default = data['is_segment_height_default']
-        leg_par._is_segment_width_default = data['is_segment_width_default']
-        leg_par._is_text_height_default = data['is_text_height_default']
+        leg_par = cls(data.get('min'), data.get('max'), data.get('segment_count'),
+                      colors, data.get('title'), base_plane)
+        leg_par.continuous_colors = data.get('continuous_colors')
+        leg_par.continuous_legend = data.get('continuous_legend')
+        leg_par.ordinal_dictionary = data.get('ordinal_dictionary')
+        leg_par.decimal_count = data.get('decimal_count')
+        leg_par.include_larger_smaller = data.get('include_larger_smaller')
+        leg_par.vertical = data.get('vertical')
+        leg_par.segment_height = data.get('segment_height')
+        leg_par.segment_width = data.get('segment_width')
+        leg_par.text_height = data.get('text_height')
+        leg_par.font = data.get('font')
+        leg_par._is_segment_count_default = data.get('is_segment_count_default', False)
+        leg_par._is_title_default = data.get('is_title_default', False)
+        leg_par._is_base_plane_default = data.get('is_base_plane_default', False)
+        leg_par._is_segment_height_default = \
+            data.get('is_segment_height_default', False)
+        leg_par._is_segment_width_default = data.get('is_segment_width_default', False)
+        leg_par._is_text_height_default = data.get('is_text_height_default', False)
         return leg_par
 
     @property
@@ -574,9 +606,10 @@ class LegendParameters(object):
     @colors.setter
     def colors(self, cols):
         if cols is not None:
-            assert isinstance(cols, Iterable) \
-                and not isinstance(cols, (str, dict, bytes, bytearray)), \
-                'Colors should be a list or tuple. Got {}'.format(type(cols))
+            if not isinstance(cols, (list, tuple)):
+                assert isinstance(cols, Iterable) \
+                    and not isinstance(cols, (str, dict, bytes, bytearray)), \
+                    'Colors should be a list or tuple. Got {}'.format(type(cols))
             assert len(cols) > 1, 'There must be at least two colors to make a legend.'
             try:
                 cols = tuple(col if isinstance(col, Color) else Color(
@@ -764,7 +797,7 @@ class LegendParameters(object):
          text_height * (max_number_of_digits + 2) where max_number_of_digits is
          the number of digits displaying in the legend parameter max.
         """
-        if not self.vertical and self.is_segment_width_default:
+        if not self._vertical and self._is_segment_width_default:
             return self.text_height * 5
         return self._segment_width
 
@@ -787,8 +820,8 @@ class LegendParameters(object):
 
         Default is 1/3 of the segment_height.
         """
-        if self.is_text_height_default:
-            return self.segment_height * 0.33
+        if self._is_text_height_default:
+            return self._segment_height * 0.33
         return self._text_height
 
     @text_height.setter
@@ -858,36 +891,44 @@ class LegendParameters(object):
 
     def to_dict(self):
         """Get legend parameters as a dictionary."""
-        seg = None if self.is_segment_count_default else self.segment_count
-        title = None if self.is_title_default else self.title
-        base_plane = None if self.is_base_plane_default else self.base_plane.to_dict()
-        seg_h = None if self.is_segment_height_default else self.segment_height
-        seg_w = None if self.is_segment_width_default else self.segment_width
-        txt_h = None if self.is_text_height_default else self.text_height
+        base_plane = None if self._is_base_plane_default else self._base_plane.to_dict()
         return {
-            'min': self.min, 'max': self.max, 'segment_count': seg,
-            'colors': [col.to_dict() for col in self.colors],
-            'continuous_colors': self.continuous_colors,
-            'continuous_legend': self.continuous_legend, 'title': title,
-            'ordinal_dictionary': self.ordinal_dictionary,
-            'decimal_count': self.decimal_count,
-            'include_larger_smaller': self.include_larger_smaller,
-            'vertical': self.vertical,
+            'min': self._min, 'max': self._max,
+            'segment_count': None if self._is_segment_count_default
+            else self._segment_count,
+            'colors': [col.to_dict() for col in self._colors],
+            'continuous_colors': self._continuous_colors,
+            'continuous_legend': self._continuous_legend,
+            'title': None if self._is_title_default else self._title,
+            'ordinal_dictionary': self._ordinal_dictionary,
+            'decimal_count': self._decimal_count,
+            'include_larger_smaller': self._include_larger_smaller,
+            'vertical': self._vertical,
             'base_plane': base_plane,
-            'segment_height': seg_h, 'segment_width': seg_w,
-            'text_height': txt_h, 'font': self.font,
-            'is_segment_count_default': self.is_segment_count_default,
-            'is_title_default': self.is_title_default,
-            'is_base_plane_default': self.is_base_plane_default,
-            'is_segment_height_default': self.is_segment_height_default,
-            'is_segment_width_default': self.is_segment_width_default,
-            'is_text_height_default': self.is_text_height_default,
+            'segment_height': None if self._is_segment_height_default
+            else self._segment_height,
+            'segment_width': None if self._is_segment_width_default
+            else self._segment_width,
+            'text_height': None if self._is_text_height_default else self._text_height,
+            'font': self._font,
+            'is_segment_count_default': self._is_segment_count_default,
+            'is_title_default': self._is_title_default,
+            'is_base_plane_default': self._is_base_plane_default,
+            'is_segment_height_default': self._is_segment_height_default,
+            'is_segment_width_default': self._is_segment_width_default,
+            'is_text_height_default': self._is_text_height_default,
             'type': 'LegendParameters'
         }
 
     def __copy__(self):
-        new_par = LegendParameters(self.min, self.max, self.segment_count,
-                                   self.colors, self.title, self.base_plane)
+        # skip __init__ since the attributes of this object are already validated
+        new_par = self.__class__.__new__(self.__class__)
+        new_par._min = self._min
+        new_par._max = self._max
+        new_par._segment_count = self._segment_count
+        new_par._colors = self._colors
+        new_par._title = self._title
+        new_par._base_plane = self._base_plane
         new_par._continuous_colors = self._continuous_colors
         new_par._continuous_legend = self._continuous_legend
         new_par._ordinal_dictionary = self._ordinal_dictionary
@@ -912,23 +953,23 @@ class LegendParameters(object):
 
     def __repr__(self):
         """Legend parameter representation."""
-        min = self.min if self.min is not None else '[default]'
-        max = self.max if self.max is not None else '[default]'
-        seg = '[default]' if self.is_segment_count_default \
-            else self.segment_count
-        title = '[default]' if self.is_title_default else self.title
-        base_pt = '[default]' if self.is_base_plane_default else self.base_plane.o
-        seg_h = '[default]' if self.is_segment_height_default else self.segment_height
-        seg_w = '[default]' if self.is_segment_width_default else self.segment_width
-        txt_h = '[default]' if self.is_text_height_default else self.text_height
+        min = self._min if self._min is not None else '[default]'
+        max = self._max if self._max is not None else '[default]'
+        seg = '[default]' if self._is_segment_count_default \
+            else self._segment_count
+        title = '[default]' if self._is_title_default else self._title
+        base_pt = '[default]' if self._is_base_plane_default else self._base_plane.o
+        seg_h = '[default]' if self._is_segment_height_default else self._segment_height
+        seg_w = '[default]' if self._is_segment_width_default else self._segment_width
+        txt_h = '[default]' if self._is_text_height_default else self._text_height
         return 'Legend Parameters\n minimum: {}\n maximum: {}\n segments: {}\n' \
             ' colors:\n  {}\n continuous colors: {}\n continuous legend: {}\n' \
             ' title: {}\n ordinal text: {}\n number decimals: {}\n' \
             ' include < >: {}\n vertical: {}\n base point:\n  {}\n' \
             ' segment height: {}\n segment width: {}\n' \
             ' text height: {}\n font: {}'.format(
-                min, max, seg, '\n  '.join([str(c) for c in self.colors]),
-                self.continuous_colors, self.continuous_legend, title,
-                self.ordinal_dictionary, self.decimal_count,
-                self.include_larger_smaller, self.vertical,
-                base_pt, seg_h, seg_w, txt_h, self.font)
+                min, max, seg, '\n  '.join([str(c) for c in self._colors]),
+                self._continuous_colors, self._continuous_legend, title,
+                self._ordinal_dictionary, self._decimal_count,
+                self._include_larger_smaller, self._vertical,
+                base_pt, seg_h, seg_w, txt_h, self._font)
@@ -416,6 +416,27 @@ def calc_sky_temperature(horiz_ir, source_emissivity=1):
     return ((horiz_ir / (source_emissivity * sigma)) ** 0.25) - 273.15
 
 
+def calc_sky_temperatures(horiz_irs, source_emissivity=1):
+    """Calculate a list of sky temperatures in Celcius.
+
+    This gives the same results as calling calc_sky_temperature for each value
+    but it avoids a function call per value, which adds up over an annual list.
+
+    Args:
+        horiz_irs: A list of float values that represent horizontal infrared
+            radiation intensity in W/m2.
+        source_emissivity: A float value between 0 and 1 indicating the emissivity
+             of the heat source that is radiating to the sky. Default is 1 for
+             most outdoor surfaces.
+
+    Returns:
+        sky_temps: A list of sky temperature values in C.
+    """
+    sigma = 5.6697e-8  # stefan-boltzmann constant
+    denominator = source_emissivity * sigma
+    return [((hir / denominator) ** 0.25) - 273.15 for hir in horiz_irs]
+
+
 """DIRECT AND DIFFUSE SPLITTING FROM GLOBAL HORIZONTAL"""
 """The following code is a modified version of the PVLib python library.
 
@@ -145,6 +145,18 @@ def test_color_range_continuous():
     assert color_range.color(1100) == Color(100, 200, 100)
 
 
+def test_color_range_multiple_domain_values():
+    """Test color range objects with a domain value for each color."""
+    colors = [Color(0, 0, 0), Color(100, 100, 100), Color(200, 200, 200)]
+    color_range = ColorRange(colors, [0, 10, 1000])
+
+    assert color_range.color(0) == Color(0, 0, 0)
+    assert color_range.color(5) == Color(50, 50, 50)
+    assert color_range.color(10) == Color(100, 100, 100)
+    assert color_range.color(505) == Color(150, 150, 150)
+    assert color_range.color(1000) == Color(200, 200, 200)
+
+
 def test_color_range_from_dict():
     """Test the from_dict method."""
     sample_dict = {'colors': [{'r': '0', 'g': '0', 'b': '0'},
@@ -1181,6 +1181,17 @@ def test_filter_collections_by_statement():
     assert isinstance(filt_coll[0], HourlyDiscontinuousCollection)
 
 
+def test_pattern_from_collections_and_statement():
+    """Test the pattern from collections with logical operators in the statement."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    dc1 = HourlyContinuousCollection(header, list(xrange(24)))
+    dc2 = HourlyContinuousCollection(header, [12] * 12 + [0] * 12)
+
+    pattern = HourlyContinuousCollection.pattern_from_collections_and_statement(
+        [dc1, dc2], 'A < 2 or not b == 12')
+    assert pattern == [True] * 2 + [False] * 10 + [True] * 12
+
+
 def test_is_in_range_data_type():
     """Test the function to check whether values are in range for the data_type."""
     header1 = Header(Temperature(), 'C', AnalysisPeriod())
@@ -48,6 +48,18 @@ def test_dict_generic():
     assert isinstance(new_type, base.DataTypeBase)
 
 
+def test_from_dict_missing_keys():
+    """Test that from_dict raises a ValueError for incomplete dictionaries."""
+    with pytest.raises(ValueError):
+        base.DataTypeBase.from_dict({'name': 'Temperature'})
+    with pytest.raises(ValueError):
+        base.DataTypeBase.from_dict({'data_type': 'Temperature'})
+    with pytest.raises(ValueError):
+        base.DataTypeBase.from_dict({'name': 'Widgets', 'data_type': 'GenericType'})
+    with pytest.raises(ValueError):
+        base.DataTypeBase.from_dict({'name': 'Widgets', 'data_type': 'Widgets'})
+
+
 def test_generic_type():
     """Test the creation of generic types."""
     test_type = generic.GenericType('Test Type', 'widgets')
@@ -72,6 +84,71 @@ def test_temperature():
     assert temp_type.to_unit([1], 'C', 'K')[0] == pytest.approx(-272.15, rel=1e-1)
 
 
+def test_units_are_tuples():
+    """Test that the units of all data types are tuples."""
+    for clss in datatype.TYPESDICT.values():
+        assert isinstance(clss._units, tuple)
+        assert isinstance(clss._si_units, tuple)
+        assert isinstance(clss._ip_units, tuple)
+    assert generic.GenericType('Test Type', 'widgets').units == ('widgets',)
+
+
+def test_converters():
+    """Test that every data type can convert between all of its units."""
+    for clss in datatype.TYPESDICT.values():
+        converters = clss._converters()
+        for from_unit in clss._units:
+            for to_unit in clss._units:
+                if from_unit != clss._units[0] or to_unit != clss._units[0]:
+                    assert (from_unit, to_unit) in converters
+
+
+def test_slots():
+    """Test that data type instances do not carry an instance dictionary."""
+    for clss in datatype.TYPESDICT.values():
+        assert not hasattr(clss(), '__dict__')
+    assert not hasattr(generic.GenericType('Test Type', 'widgets'), '__dict__')
+
+
+def test_is_numeric():
+    """Test that non-numeric values are rejected before unit conversion."""
+    temp_type = temperature.Temperature()
+    assert temp_type.to_unit([], 'F', 'C') == []
+    assert temp_type.to_unit((0, 100), 'F', 'C') == pytest.approx([32, 212])
+    with pytest.raises(AssertionError):
+        temp_type.to_unit(['a', 'b'], 'F', 'C')
+    with pytest.raises(AssertionError):
+        temp_type.is_in_range(('a', 'b'))
+
+
+def test_is_in_range():
+    """Test the is_in_range method."""
+    temp_type = temperature.Temperature()
+    assert temp_type.is_in_range([])
+    assert temp_type.is_in_range([-100, 0, 100])
+    assert temp_type.is_in_range([-100, 0, 100], 'F')
+    assert not temp_type.is_in_range([0, -300, 100], raise_exception=False)
+    assert not temp_type.is_in_range([0, -300, 100], 'K', raise_exception=False)
+    with pytest.raises(ValueError):
+        temp_type.is_in_range([0, -300, 100])
+    assert generic.GenericType('Test Type', 'widgets').is_in_range([-1e9, 1e9])
+
+
+def test_to_unit_numpy_array():
+    """Test that numpy arrays are converted as a whole."""
+    np = pytest.importorskip('numpy')
+    temp_type = temperature.Temperature()
+    values = np.array([0, 100])
+    f_values = temp_type.to_unit(values, 'F', 'C')
+    assert isinstance(f_values, np.ndarray)
+    assert list(f_values) == pytest.approx([32, 212], rel=1e-5)
+    k_values = temp_type.to_unit(f_values, 'K', 'F')
+    assert list(k_values) == pytest.approx([273.15, 373.15], rel=1e-5)
+    assert list(values) == [0, 100]
+    with pytest.raises(AssertionError):
+        temp_type.to_unit(np.array(['a', 'b']), 'F', 'C')
+
+
 def test_temperaturedelta():
     """Test TemperatureDelta type."""
     temp_type = temperaturedelta.TemperatureDelta()
@@ -1,5 +1,5 @@
 # coding=utf-8
-from ladybug.epw import EPW
+from ladybug.epw import EPW, EPWFields
 from ladybug.datacollection import HourlyContinuousCollection, MonthlyCollection
 from ladybug.designday import DesignDay
 from ladybug.analysisperiod import AnalysisPeriod
@@ -73,6 +73,40 @@ def test_invalid_epw():
         epw.location
 
 
+def test_import_truncated_epw():
+    """Test that a row with missing values raises an error with its line number."""
+    path = './tests/epw/chicago.epw'
+    truncated_path = './tests/epw/chicago_truncated.epw'
+    with open(path) as epw_f:
+        lines = epw_f.readlines()
+    lines[-1] = ','.join(lines[-1].split(',')[:20]) + '\n'
+    with open(truncated_path, 'w') as epw_f:
+        epw_f.writelines(lines)
+
+    epw = EPW(truncated_path)
+    with pytest.raises(ValueError) as e:
+        epw.dry_bulb_temperature
+    assert 'Line {}'.format(len(lines)) in str(e.value)
+    os.remove(truncated_path)
+
+
+def test_import_short_location_line():
+    """Test that a LOCATION line with missing fields raises a ValueError."""
+    path = './tests/epw/chicago.epw'
+    short_path = './tests/epw/chicago_short_location.epw'
+    with open(path) as epw_f:
+        lines = epw_f.readlines()
+    lines[0] = 'LOCATION,Chicago Ohare Intl Ap,IL,USA\n'
+    with open(short_path, 'w') as epw_f:
+        epw_f.writelines(lines)
+
+    epw = EPW(short_path)
+    with pytest.raises(ValueError) as e:
+        epw.location
+    assert 'LOCATION' in str(e.value)
+    os.remove(short_path)
+
+
 def test_import_data():
     """Test the imported data properties."""
     relative_path = './tests/epw/chicago.epw'
@@ -108,6 +142,12 @@ def test_import_data():
     assert isinstance(epw.liquid_precipitation_depth, HourlyContinuousCollection)
     assert isinstance(epw.liquid_precipitation_quantity, HourlyContinuousCollection)
     assert isinstance(epw.sky_temperature, HourlyContinuousCollection)
+    assert epw.metadata['city'] == 'Chicago Ohare Intl Ap'
+
+    # editing the metadata of one header should not change the others
+    epw.dry_bulb_temperature.header.metadata['foo'] = 1
+    assert 'foo' not in epw.metadata
+    assert 'foo' not in epw.relative_humidity.header.metadata
 
 
 def test_convert_to_ip():
@@ -125,6 +165,18 @@ def test_convert_to_ip():
     assert epw.dry_bulb_temperature.values[0] == pytest.approx(-6.1, rel=1e-5)
 
 
+def test_convert_to_ip_unaccessed_fields():
+    """Test that fields accessed after conversion are also in IP units."""
+    relative_path = './tests/epw/chicago.epw'
+    epw = EPW(relative_path)
+    epw.dry_bulb_temperature
+    epw.convert_to_ip()
+    assert epw.wind_speed.header.unit == 'mph'
+    assert epw.atmospheric_station_pressure.header.unit == 'inHg'
+    epw.convert_to_si()
+    assert epw.wind_speed.header.unit == 'm/s'
+
+
 def test_set_data():
     """Test the ability to set the data of any of the epw hourly data."""
     relative_path = './tests/epw/chicago.epw'
@@ -197,6 +249,40 @@ def test_import_design_days():
     assert epw.annual_cooling_design_day_010.dry_bulb_condition.dry_bulb_max == 31.6
 
 
+def test_design_day_pressure_cache():
+    """Test that design days follow edits to the atmospheric station pressure."""
+    relative_path = './tests/epw/chicago.epw'
+    epw = EPW(relative_path)
+    init_press = epw.annual_heating_design_day_996.humidity_condition.barometric_pressure
+    assert epw.annual_cooling_design_day_004.humidity_condition.barometric_pressure == \
+        init_press
+
+    epw.atmospheric_station_pressure[0] = 200000
+    new_press = epw.annual_heating_design_day_996.humidity_condition.barometric_pressure
+    assert new_press > init_press
+
+    epw.atmospheric_station_pressure.values = [999999] * 8760
+    dday = epw.annual_heating_design_day_990
+    assert dday.humidity_condition.barometric_pressure == 101325
+
+
+def test_header_climate_data_set_after_location():
+    """Test that lazily parsed header data does not overwrite values set on the EPW."""
+    relative_path = './tests/epw/chicago.epw'
+    epw = EPW(relative_path)
+    assert epw.location.city == 'Chicago Ohare Intl Ap'
+
+    heat_dict = dict(epw.heating_design_condition_dictionary)
+    heat_dict['DB996'] = '-30'
+    epw = EPW(relative_path)
+    epw.location
+    epw.heating_design_condition_dictionary = heat_dict
+    assert epw.heating_design_condition_dictionary['DB996'] == '-30'
+    assert len(epw.cooling_design_condition_dictionary) > 0
+    assert len(epw.monthly_ground_temperature) == 3
+    assert '-30' in epw.header[1]
+
+
 def test_import_extreme_weeks():
     """Test the functions that import the extreme weeks."""
     relative_path = './tests/epw/chicago.epw'
@@ -296,15 +382,29 @@ def test_epw_header():
             assert len(line1.split(',')) == len(line2.split(','))
 
 
+def test_field_by_number():
+    """Test that the EPW fields are only built once."""
+    field = EPWFields.field_by_number(6)
+    assert field.value_type is float
+    assert field.unit == 'C'
+    assert EPWFields.field_by_number(6) is field
+    with pytest.raises(KeyError):
+        EPWFields.field_by_number(35)
+
+
 def test_save_epw():
     """Test save epw_rel."""
     path = './tests/epw/tokyo.epw'
     epw = EPW(path)
 
+    dry_bulb = epw.dry_bulb_temperature.values
     modified_path = './tests/epw/tokyo_modified.epw'
     epw.save(modified_path)
     assert os.path.isfile(modified_path)
     assert os.stat(modified_path).st_size > 1
+    assert epw.dry_bulb_temperature.values == dry_bulb
+    new_epw = EPW(modified_path)
+    assert new_epw.dry_bulb_temperature.values == dry_bulb
     os.remove(modified_path)
 
 
@@ -324,9 +424,11 @@ def test_save_converted_epw():
     epw = EPW(relative_path)
     epw.convert_to_ip()
     modified_path = './tests/epw/chicago_modified.epw'
+    ip_dry_bulb = epw.dry_bulb_temperature.values
     epw.save(modified_path)
     assert epw.dry_bulb_temperature.header.unit == 'F'
     assert epw.dry_bulb_temperature.values[0] == pytest.approx(21.02, rel=1e-2)
+    assert epw.dry_bulb_temperature.values == ip_dry_bulb
 
     new_epw = EPW(modified_path)
     assert new_epw.dry_bulb_temperature.header.unit == 'C'
@@ -352,3 +454,8 @@ def test_save_wea():
         assert float(line[17].split(' ')[-1]) == epw.diffuse_horizontal_radiation[11]
 
     os.remove(wea_path)
+
+    # an invalid hoy should raise before any file is written
+    with pytest.raises(IndexError):
+        epw.to_wea(wea_path, hoys=[0, 8760])
+    assert not os.path.isfile(wea_path)
@@ -46,3 +46,45 @@ def test_csv_to_matrix():
 
     with pytest.raises(Exception):
         epw_mtx = futil.csv_to_num_matrix(path)
+
+
+def test_write_lines_to_file():
+    """Test writing an iterable of lines to a file."""
+    file_path = './tests/zip/lines.txt'
+    lines = ('{}\n'.format(i) for i in range(3))
+    assert futil.write_lines_to_file(file_path, lines) == file_path
+    with open(file_path) as inf:
+        assert inf.read() == '0\n1\n2\n'
+    os.remove(file_path)
+
+
+def test_write_lines_to_file_failed_lines():
+    """Test that an error while generating lines leaves no partial file."""
+    file_path = './tests/zip/lines.txt'
+
+    def bad_lines():
+        yield '0\n'
+        raise ValueError('bad line')
+
+    with pytest.raises(ValueError):
+        futil.write_lines_to_file(file_path, bad_lines())
+    assert not os.path.isfile(file_path)
+    assert not [f for f in os.listdir('./tests/zip') if f.startswith('lines.txt')]
+
+    # existing files should be left as they are, including one named like a temp file
+    with open(file_path, 'w') as outf:
+        outf.write('existing\n')
+    with open(file_path + '.tmp', 'w') as outf:
+        outf.write('user file\n')
+    with pytest.raises(ValueError):
+        futil.write_lines_to_file(file_path, bad_lines())
+    with open(file_path) as inf:
+        assert inf.read() == 'existing\n'
+
+    futil.write_lines_to_file(file_path, ['new\n'])
+    with open(file_path) as inf:
+        assert inf.read() == 'new\n'
+    with open(file_path + '.tmp') as inf:
+        assert inf.read() == 'user file\n'
+    os.remove(file_path)
+    os.remove(file_path + '.tmp')
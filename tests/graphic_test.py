@@ -45,6 +45,19 @@ def test_init_graphic_con():
     assert graphic_con.upper_title_location != Plane()
 
 
+def test_title_location_text_height():
+    """Test that the title locations follow changes to the text height."""
+    mesh2d = Mesh2D.from_grid(num_x=2, num_y=2)
+    mesh3d = Mesh3D.from_mesh2d(mesh2d)
+    graphic_con = GraphicContainer([0, 1, 2, 3], mesh3d.min, mesh3d.max)
+
+    lower_title = graphic_con.lower_title_location
+    assert graphic_con.lower_title_location is lower_title
+    graphic_con.legend_parameters.text_height = 2
+    assert graphic_con.lower_title_location.o.y == pytest.approx(-5, rel=1e-3)
+    assert graphic_con.upper_title_location.o.y == pytest.approx(4, rel=1e-3)
+
+
 def test_to_from_dict():
     """Test the to/from dict methods."""
     mesh2d = Mesh2D.from_grid(num_x=2, num_y=2)
@@ -144,3 +157,17 @@ def test_init_graphic_con_data_type_ordinal():
     assert graphic_con.legend.segment_text == ['Cold', 'Cool', 'Slightly Cool',
                                                'Neutral',
                                                'Slightly Warm', 'Warm', 'Hot']
+
+
+def test_init_graphic_con_data_type_ordinal_custom_min():
+    """Test the ResultMesh objects with a DataType with unit_descr and a custom min."""
+    mesh2d = Mesh2D.from_grid(num_x=2, num_y=2)
+    mesh3d = Mesh3D.from_mesh2d(mesh2d)
+    data = [-1, 0, 1, 2]
+    legend_par = LegendParameters(min=-2.5)
+    graphic_con = GraphicContainer(data, mesh3d.min, mesh3d.max, legend_par,
+                                   data_type=PredictedMeanVote(), unit='PMV')
+
+    assert graphic_con.legend_parameters.min == -2.5
+    assert graphic_con.legend_parameters.max == 3
+    assert graphic_con.legend_parameters.is_segment_count_default is True
@@ -32,6 +32,11 @@ def test_init_legend_parameters():
     assert leg_par_copy.min == leg_par.min
     assert leg_par_copy.max == leg_par.max
     assert leg_par_copy.segment_count == leg_par.segment_count
+    assert leg_par_copy.to_dict() == leg_par.to_dict()
+    leg_par_copy.max = 500
+    leg_par_copy.title = 'C'
+    assert leg_par.max == 1000
+    assert leg_par.is_title_default is True
 
 
 def test_to_from_dict():
@@ -41,6 +46,11 @@ def test_to_from_dict():
     new_leg_par = LegendParameters.from_dict(leg_par_dict)
     assert new_leg_par.to_dict() == leg_par_dict
 
+    sample_dict = {'min': -3, 'max': 3, 'segment_count': 7}
+    leg_par = LegendParameters.from_dict(sample_dict)
+    assert leg_par.segment_count == 7
+    assert sample_dict == {'min': -3, 'max': 3, 'segment_count': 7}
+
 
 def test_colors():
     """Test the LegendParameter colors property."""
@@ -305,6 +315,15 @@ def test_init_legend():
     assert legend_copy.legend_parameters.is_text_height_default is True
 
 
+def test_init_legend_generator():
+    """Test the initialization of Legend objects with a generator of values."""
+    legend = Legend(val * 2 for val in range(5))
+    assert legend.values == [0, 2, 4, 6, 8]
+    assert legend.legend_parameters.min == 0
+    assert legend.legend_parameters.max == 8
+    assert len(legend.value_colors) == 5
+
+
 def test_init_legend_with_parameter():
     """Test the initialization of Legend with LegendParameter objects."""
     legend = Legend([0, 10], LegendParameters(2, 8))
@@ -323,6 +342,11 @@ def test_legend_to_from_dict():
     new_legend = Legend.from_dict(legend_dict)
     assert new_legend.to_dict() == legend_dict
 
+    sample_dict = {'values': [0, 10]}
+    legend = Legend.from_dict(sample_dict)
+    assert legend.is_min_default is False
+    assert sample_dict == {'values': [0, 10]}
+
 
 def test_legend_value_colors():
     """Test the color_range, value_colors, and segment_colors property."""
@@ -338,6 +362,34 @@ def test_legend_value_colors():
     assert legend.segment_colors == Colorset.original()
 
 
+def test_legend_value_colors_changed_inputs():
+    """Test that the value_colors follow changes to the values and parameters."""
+    values = [0, 1, 2, 3, 4]
+    legend = Legend(values)
+    value_colors = legend.value_colors
+    assert legend.value_colors == value_colors
+
+    legend.legend_parameters.max = 8
+    assert legend.value_colors[-1] != Colorset.original()[-1]
+    legend.legend_parameters.max = 4
+    assert legend.value_colors == value_colors
+
+    values[-1] = 2
+    assert legend.value_colors[-1] == value_colors[2]
+    values.append(4)
+    assert len(legend.value_colors) == 6
+
+    # editing the returned colors should not change the colors of the legend
+    value_colors[0].r = 0
+    legend.segment_colors[0].r = 0
+    assert legend.value_colors[0] == Color(75, 107, 169)
+    assert legend.segment_colors[0] == Color(75, 107, 169)
+
+    legend.legend_parameters.colors[0].r = 0
+    assert legend.value_colors[0] == Color(0, 107, 169)
+    assert legend.segment_colors[0] == Color(0, 107, 169)
+
+
 def test_legend_title():
     """Test the title property."""
     legend = Legend(range(5))
@@ -375,6 +427,12 @@ def test_segment_text():
     for pl in legend.segment_text_location:
         assert isinstance(pl, Plane)
 
+    legend_par = LegendParameters(segment_count=11)
+    legend_par.segment_height = 0.1
+    legend = Legend(range(10), legend_par)
+    assert len(legend.segment_text_location) == len(legend.segment_text) == 11
+    assert legend.segment_text_location_2d[-1].y == pytest.approx(1, rel=1e-3)
+
 
 def test_segment_text_ordinal_dictionary():
     """Test the segment_text property with ordinal dictionary."""
@@ -426,6 +484,9 @@ def test_segment_mesh():
     legend.legend_parameters.continuous_legend = True
     assert len(legend.segment_mesh.faces) == 5
     assert len(legend.segment_mesh.vertices) == 12
+    seg_colors = legend.segment_colors
+    assert legend.segment_mesh.colors[:4] == \
+        (seg_colors[0], seg_colors[0], seg_colors[1], seg_colors[1])
     legend.legend_parameters.vertical = True
     assert len(legend.segment_mesh.faces) == 5
     assert len(legend.segment_mesh.vertices) == 12
@@ -1,6 +1,6 @@
 # coding=utf-8
 from ladybug.skymodel import estimate_illuminance_from_irradiance, \
-    dirint, disc, _get_dirint_coeffs
+    dirint, disc, _get_dirint_coeffs, calc_sky_temperature, calc_sky_temperatures
 
 import pytest
 import math
@@ -25,6 +25,16 @@ def test_estimate_illuminance_from_irradiance():
     assert z_lum == 0
 
 
+def test_calc_sky_temperatures():
+    """Test that calc_sky_temperatures matches calc_sky_temperature."""
+    horiz_irs = [250, 300.5, 412]
+    assert calc_sky_temperatures(horiz_irs) == \
+        [calc_sky_temperature(hir) for hir in horiz_irs]
+    assert calc_sky_temperatures(horiz_irs, 0.9) == \
+        [calc_sky_temperature(hir, 0.9) for hir in horiz_irs]
+    assert calc_sky_temperatures([]) == []
+
+
 def test_dirint():
     """Test the accuracy of the dirint model against pvlib results."""
     dirint_result = dirint(